@@ -0,0 +1,97 @@
+"""
+Compare the thread and asyncio enrichment engines against a local stub of
+the MW Dictionary API at 100, 1,000 and 10,000 words.
+
+The stub answers every lookup with the same small entry after an optional
+simulated latency. Rate limiting is lifted and the response cache is off, so
+the numbers reflect engine overhead and achieved concurrency only.
+
+Usage (from the repository root; the async engine needs aiohttp):
+    python -m benchmarks.bench_enrich [--latency-ms 20] [--sizes 100 1000 10000]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from merriam_dictionary import async_dictionary, dictionary
+from merriam_dictionary.ratelimit import TokenBucket
+
+_ENTRY = json.dumps(
+    [
+        {
+            "meta": {"id": "stub"},
+            "shortdef": ["a stand-in definition"],
+            "def": [{"sseq": [[["sense", {"dt": [["vis", [{"t": "a {it}stub{/it} example"}]]]}]]]}],
+        }
+    ]
+).encode()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    latency_secs = 0.0
+
+    def do_GET(self) -> None:
+        if self.latency_secs:
+            time.sleep(self.latency_secs)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(_ENTRY)))
+        self.end_headers()
+        self.wfile.write(_ENTRY)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+def _start_stub(latency_secs: float) -> ThreadingHTTPServer:
+    _StubHandler.latency_secs = latency_secs
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _time_engine(engine: str, words: list[str]) -> float:
+    start = time.perf_counter()
+    if engine == "async":
+        asyncio.run(async_dictionary.enrich_words_async(words, "stub-key"))
+    else:
+        dictionary.enrich_words(words, "stub-key")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    server = _start_stub(args.latency_ms / 1000)
+    base_url = f"http://127.0.0.1:{server.server_port}/json"
+    dictionary.DICT_API_BASE_URL = base_url
+    async_dictionary.DICT_API_BASE_URL = base_url
+    unlimited = TokenBucket(rate=1e9, burst=1_000_000)
+    dictionary._rate_limiter = unlimited
+    async_dictionary._rate_limiter = unlimited
+
+    print(f"{'words':>7} {'thread s':>10} {'async s':>10} {'thread w/s':>12} {'async w/s':>11}")
+    for size in args.sizes:
+        words = [f"word{i}" for i in range(size)]
+        thread_s = _time_engine("thread", words)
+        async_s = _time_engine("async", words)
+        print(
+            f"{size:>7} {thread_s:>10.2f} {async_s:>10.2f} "
+            f"{size / thread_s:>12.0f} {size / async_s:>11.0f}"
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
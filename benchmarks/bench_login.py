@@ -0,0 +1,60 @@
+"""
+Compare cold-start time and peak RSS of the login strategies.
+
+Each trial runs in a fresh interpreter so import and browser start-up costs
+are included. Peak RSS is taken from wait4(), which reports the largest
+resident set of the child and any descendants it waited on (Chromium).
+
+Usage (from the repository root):
+    MW_EMAIL=... MW_PASSWORD=... python -m benchmarks.bench_login [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+_TRIAL = (
+    "import os\n"
+    "from merriam_dictionary.auth import login_and_get_cookies\n"
+    "login_and_get_cookies(os.environ['MW_EMAIL'], os.environ['MW_PASSWORD'], {strategy!r})\n"
+)
+
+
+def _run_trial(strategy: str) -> tuple[float, float]:
+    """Returns (wall seconds, peak RSS in MiB) for one login in a new process."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-c", _TRIAL.format(strategy=strategy)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    _, status, usage = os.wait4(proc.pid, 0)
+    elapsed = time.perf_counter() - start
+    if os.waitstatus_to_exitcode(status) != 0:
+        raise RuntimeError(f"{strategy} login failed")
+    # ru_maxrss is reported in KiB on Linux.
+    return elapsed, usage.ru_maxrss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=3)
+    args = parser.parse_args()
+
+    for key in ("MW_EMAIL", "MW_PASSWORD"):
+        if not os.environ.get(key):
+            sys.exit(f"{key} must be set")
+
+    print(f"{'strategy':<10} {'median s':>10} {'peak RSS MiB':>14}")
+    for strategy in ("http", "browser"):
+        trials = [_run_trial(strategy) for _ in range(args.runs)]
+        median_s = statistics.median(t[0] for t in trials)
+        peak_mib = max(t[1] for t in trials)
+        print(f"{strategy:<10} {median_s:>10.2f} {peak_mib:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
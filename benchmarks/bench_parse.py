@@ -0,0 +1,152 @@
+"""
+Compare the previous example parser (per-example regex strip, list-based
+dedupe, plain senses only) with dictionary._parse_examples on the fixture
+corpus in benchmarks/fixtures, and on entries scaled up to many senses.
+
+The fixture entries are small and hand-made. The new parser walks more of
+them (pseq, bs, uns, snote) and renders markup the regex only stripped, so
+the whole-entry times are not like for like; the markup stage is also timed
+on the fixture's own example strings, split into {it}/{wi}-only and other
+markup. Half of the scaled (synthetic) examples repeat earlier ones, so the
+dedupe does real work; the old list lookup makes that quadratic.
+
+Usage (from the repository root):
+    python -m benchmarks.bench_parse [--sizes 10 100 1000 5000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+from collections.abc import Callable
+
+from merriam_dictionary.dictionary import _parse_examples
+from merriam_dictionary.markup import render_text
+
+_FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "mw_responses.json")
+_OLD_TAGS = re.compile(r"\{/?[a-z_]+\}")
+_HEADWORD_TAGS = re.compile(r"\{/?(?:it|wi)\}")
+
+
+def _baseline_parse_examples(entry: dict) -> list[str]:
+    """The parser as it was before the markup tokenizer, kept for comparison."""
+    examples: list[str] = []
+    for def_block in entry.get("def", []):
+        for sense_group in def_block.get("sseq", []):
+            for sense_entry in sense_group:
+                if len(sense_entry) < 2 or not isinstance(sense_entry[1], dict):
+                    continue
+                for dt_item in sense_entry[1].get("dt", []):
+                    if not dt_item or dt_item[0] != "vis":
+                        continue
+                    for ex in dt_item[1]:
+                        text = _OLD_TAGS.sub("", ex.get("t", "")).strip()
+                        if text and text not in examples:
+                            examples.append(text)
+    return examples
+
+
+def _load_entries() -> list[dict]:
+    with open(_FIXTURE) as f:
+        corpus = json.load(f)
+    return [entry for response in corpus.values() for entry in response if isinstance(entry, dict)]
+
+
+def _example_strings(node: object) -> list[str]:
+    """Every raw vis "t" string under node, wherever it is nested."""
+    if isinstance(node, dict):
+        return [t for value in node.values() for t in _example_strings(value)]
+    if not isinstance(node, list):
+        return []
+    if len(node) == 2 and node[0] == "vis":
+        return [ex.get("t", "") for ex in node[1]]
+    return [t for value in node for t in _example_strings(value)]
+
+
+def _old_stage(texts: list[str]) -> list[str]:
+    examples: list[str] = []
+    for raw in texts:
+        text = _OLD_TAGS.sub("", raw).strip()
+        if text and text not in examples:
+            examples.append(text)
+    return examples
+
+
+def _new_stage(texts: list[str]) -> list[str]:
+    examples: dict[str, None] = {}
+    for raw in texts:
+        text = render_text(raw).strip()
+        if text:
+            examples[text] = None
+    return list(examples)
+
+
+def _scaled_entry(entries: list[dict], size: int) -> dict:
+    """One entry with size examples, one per sense, drawn from the fixture's examples."""
+    templates = [
+        ex["t"]
+        for entry in entries
+        for def_block in entry.get("def", [])
+        for sense_group in def_block["sseq"]
+        for sense_entry in sense_group
+        if isinstance(sense_entry[1], dict)
+        for dt_item in sense_entry[1].get("dt", [])
+        if dt_item[0] == "vis"
+        for ex in dt_item[1]
+    ]
+    senses = []
+    for i in range(size):
+        template = templates[i % len(templates)]
+        text = template if i % 2 else f"{template} ({i})"
+        senses.append([["sense", {"dt": [["vis", [{"t": text}]]]}]])
+    return {"meta": {"id": "scaled"}, "def": [{"sseq": senses}]}
+
+
+def _best_ms(parse: Callable[[dict], list[str]], entries: list[dict], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for entry in entries:
+            parse(entry)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1_000, 5_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    entries = _load_entries()
+    found_old = [ex for e in entries for ex in _baseline_parse_examples(e)]
+    found_new = [ex for e in entries for ex in _parse_examples(e)]
+    print(f"fixture: {len(entries)} entries; examples found: old {len(found_old)}, "
+          f"new {len(found_new)}; with leftover markup: old "
+          f"{sum('{' in ex for ex in found_old)}, new {sum('{' in ex for ex in found_new)}")
+    corpus_old = _best_ms(_baseline_parse_examples, entries * 100, args.repeat)
+    corpus_new = _best_ms(_parse_examples, entries * 100, args.repeat)
+    print(f"fixture x100, whole entries: old {corpus_old:.2f} ms, new {corpus_new:.2f} ms "
+          f"({corpus_old / corpus_new:.2f}x)")
+
+    texts = _example_strings(entries)
+    plain = [t for t in texts if "{" not in _HEADWORD_TAGS.sub("", t)]
+    other = [t for t in texts if "{" in _HEADWORD_TAGS.sub("", t)]
+    for label, subset in (("all", texts), ("{it}/{wi} only", plain), ("other markup", other)):
+        old_ms = _best_ms(_old_stage, [subset] * 100, args.repeat)
+        new_ms = _best_ms(_new_stage, [subset] * 100, args.repeat)
+        print(f"fixture x100, markup + dedupe on {len(subset)} example strings ({label}): "
+              f"old {old_ms:.2f} ms, new {new_ms:.2f} ms ({old_ms / new_ms:.2f}x)")
+    print()
+
+    print(f"{'synthetic':>9} {'old ms':>10} {'new ms':>10} {'speedup':>8}")
+    for size in args.sizes:
+        scaled = [_scaled_entry(entries, size)]
+        old_ms = _best_ms(_baseline_parse_examples, scaled, args.repeat)
+        new_ms = _best_ms(_parse_examples, scaled, args.repeat)
+        print(f"{size:>9} {old_ms:>10.2f} {new_ms:>10.2f} {old_ms / new_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,18 @@
 merriam_dictionary — export Merriam-Webster saved words with definitions.
 
 Modules:
-    auth        Playwright-based login and cookie extraction.
-    wordlist    Paginated HTTP fetch of the user's saved-words list.
-    dictionary  MW Dictionary API lookup and response parsing.
-    models      DictionaryEntry dataclass.
-    config      Constants, AppConfig dataclass, and env-var loader.
+    auth              Playwright-based login, cookie extraction and cookie cache.
+    wordlist          Paginated, streaming HTTP fetch of the user's saved-words list.
+    dictionary        MW Dictionary API lookup and response parsing.
+    markup            MW markup tokenizer rendering to text, HTML or Markdown.
+    normalize         Canonical lookup keys and URL encoding for saved words.
+    async_dictionary  Asyncio/aiohttp enrichment engine.
+    export            Streaming export sinks: JSON/NDJSON files and SQLite + FTS5.
+    cache             Persistent SQLite cache of dictionary lookups.
+    ratelimit         Token-bucket rate limiter and adaptive concurrency limit.
+    retry             Backoff-with-jitter helpers for transient HTTP failures.
+    deadline          Whole-run deadline shared by the lookup schedulers.
+    models            DictionaryEntry dataclass.
+    config            Constants, AppConfig dataclass, and env-var loader.
+    storage           Private (0600) JSON files under the cache directory.
 """
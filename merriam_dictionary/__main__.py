@@ -3,14 +3,47 @@ Entry point: python -m merriam_dictionary [options]
 """
 
 import argparse
-import json
+import asyncio
 import logging
 import sys
+from collections.abc import AsyncIterator, Iterator
 
-from .auth import login_and_get_cookies
-from .config import DEFAULT_LOG_FILE, DEFAULT_OUTPUT_FILE, load_config
-from .dictionary import enrich_words
-from .wordlist import fetch_saved_words
+from .async_dictionary import iter_enriched_async
+from .auth import clear_cached_cookies, get_cookies
+from .cache import DictionaryCache
+from .config import (
+    DEFAULT_CACHE_DIR,
+    DEFAULT_ENRICH_ENGINE,
+    DEFAULT_ENTRY_FIELDS,
+    DEFAULT_EXPORT_COMPRESSION,
+    DEFAULT_EXPORT_FORMAT,
+    DEFAULT_HOMOGRAPH_MODE,
+    DEADLINE_MARGIN_SECS,
+    DICT_CACHE_TTL_SECS,
+    ENRICH_ENGINES,
+    ENTRY_FIELDS,
+    EXPORT_COMPRESSIONS,
+    EXPORT_FORMATS,
+    HOMOGRAPH_MODES,
+    DEFAULT_LOG_FILE,
+    DEFAULT_LOGIN_STRATEGY,
+    DEFAULT_OUTPUT_FILE,
+    LOGIN_STRATEGIES,
+    AppConfig,
+    load_config,
+)
+from .deadline import Deadline
+from .dictionary import iter_enriched
+from .export import (
+    SQLITE_FIELDS,
+    ExportWriter,
+    SqliteExportWriter,
+    default_output_file,
+    open_export,
+    read_export,
+)
+from .models import DictionaryEntry
+from .wordlist import SessionRejectedError, iter_saved_word_pages, words_from_pages
 
 
 _LEVEL_COLORS: dict[str, str] = {
@@ -37,6 +70,8 @@ def _setup_logging(log_to_stderr: bool, log_file: str | None) -> None:
     """
     root = logging.getLogger()
     root.setLevel(logging.DEBUG)
+    # urllib3 logs every request URL at DEBUG, including the ?key= API key.
+    logging.getLogger("urllib3").setLevel(logging.INFO)
     fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
     if log_to_stderr:
@@ -50,20 +85,44 @@ def _setup_logging(log_to_stderr: bool, log_file: str | None) -> None:
         root.addHandler(file_handler)
 
 
+def _parse_fields(value: str) -> tuple[str, ...]:
+    fields = tuple(dict.fromkeys(name.strip() for name in value.split(",") if name.strip()))
+    unknown = [name for name in fields if name not in ENTRY_FIELDS]
+    if unknown or not fields:
+        raise argparse.ArgumentTypeError(
+            f"expected a comma-separated list of: {', '.join(ENTRY_FIELDS)}"
+        )
+    return fields
+
+
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Export Merriam-Webster saved words with definitions and examples."
     )
     parser.add_argument(
         "--output",
-        default=DEFAULT_OUTPUT_FILE,
         metavar="FILE",
-        help=f"Output JSON file path (default: {DEFAULT_OUTPUT_FILE})",
+        help=f"Output file path (default: {DEFAULT_OUTPUT_FILE}, with the extension "
+        "following --format and --compress)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default=DEFAULT_EXPORT_FORMAT,
+        help="Export format: indented JSON, compact JSON, one entry per line, or a "
+        f"SQLite database with a full-text index (default: {DEFAULT_EXPORT_FORMAT})",
+    )
+    parser.add_argument(
+        "--compress",
+        choices=EXPORT_COMPRESSIONS,
+        default=DEFAULT_EXPORT_COMPRESSION,
+        help="Compress the output file (zstd needs zstandard) "
+        f"(default: {DEFAULT_EXPORT_COMPRESSION})",
     )
     parser.add_argument(
         "--print-json",
         action="store_true",
-        help="Print JSON output to stdout in addition to writing the output file",
+        help="Stream the (uncompressed) output to stdout in addition to writing the output file",
     )
     parser.add_argument(
         "--no-stderr-log",
@@ -81,7 +140,165 @@ def _parse_args() -> argparse.Namespace:
         metavar="FILE",
         help=f"Log file path (default: {DEFAULT_LOG_FILE})",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--cache-dir",
+        default=DEFAULT_CACHE_DIR,
+        metavar="DIR",
+        help=f"Directory for cached session state (default: {DEFAULT_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--fresh-login",
+        action="store_true",
+        help="Ignore cached session cookies and log in again",
+    )
+    parser.add_argument(
+        "--login-strategy",
+        choices=LOGIN_STRATEGIES,
+        default=DEFAULT_LOGIN_STRATEGY,
+        help="How to log in: direct HTTP form POST, headless browser, or HTTP "
+        f"with browser fallback (default: {DEFAULT_LOGIN_STRATEGY})",
+    )
+    parser.add_argument(
+        "--no-dict-cache",
+        action="store_true",
+        help="Do not read or write the persistent dictionary response cache",
+    )
+    parser.add_argument(
+        "--dict-cache-ttl",
+        type=float,
+        default=DICT_CACHE_TTL_SECS,
+        metavar="SECS",
+        help=f"Reuse cached dictionary lookups younger than this (default: {DICT_CACHE_TTL_SECS})",
+    )
+    parser.add_argument(
+        "--redirect-stems",
+        action="store_true",
+        help="Answer uncached inflections (e.g. 'ran') from their cached headword's "
+        "response; words with entries of their own, such as 'left' or 'saw', "
+        "may be exported as the headword",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=ENRICH_ENGINES,
+        default=DEFAULT_ENRICH_ENGINE,
+        help="Dictionary lookup engine: thread pool or asyncio (needs aiohttp) "
+        f"(default: {DEFAULT_ENRICH_ENGINE})",
+    )
+    parser.add_argument(
+        "--fields",
+        type=_parse_fields,
+        default=DEFAULT_ENTRY_FIELDS,
+        metavar="LIST",
+        help=f"Comma-separated entry fields to extract and export, from: {', '.join(ENTRY_FIELDS)} "
+        f"(default: {','.join(DEFAULT_ENTRY_FIELDS)})",
+    )
+    parser.add_argument(
+        "--homographs",
+        choices=HOMOGRAPH_MODES,
+        default=DEFAULT_HOMOGRAPH_MODE,
+        help="Homographs such as bear (noun) and bear (verb): keep the first entry, export "
+        "one record per homograph, or merge them into one record "
+        f"(default: {DEFAULT_HOMOGRAPH_MODE})",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        metavar="SECS",
+        help="Stop starting new lookups shortly before SECS seconds into the run; "
+        'remaining words are served from cache or skipped and the export is marked "incomplete"',
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only look up words saved since the previous export in --output, "
+        "stopping pagination at the first already-exported word. Words removed "
+        "from the saved list are not dropped from the export.",
+    )
+    args = parser.parse_args()
+    if args.deadline is not None and args.deadline <= DEADLINE_MARGIN_SECS:
+        parser.error(
+            f"--deadline must be more than {DEADLINE_MARGIN_SECS:g} s, the time kept "
+            "back for requests in flight"
+        )
+    if args.format == "sqlite" and args.compress != "none":
+        parser.error("--compress does not apply to --format sqlite")
+    unstored = [name for name in args.fields if name not in SQLITE_FIELDS]
+    if args.format == "sqlite" and unstored:
+        parser.error(
+            f"--format sqlite stores only {', '.join(SQLITE_FIELDS)}; "
+            f"use another format for: {', '.join(unstored)}"
+        )
+    return args
+
+
+def _chain_pages(first: list[str], pages: Iterator[list[str]]) -> Iterator[list[str]]:
+    try:
+        yield first
+        yield from pages
+    finally:
+        pages.close()  # type: ignore[attr-defined]
+
+
+def _iter_pages(
+    config: AppConfig,
+    use_cookie_cache: bool,
+    login_strategy: str,
+) -> Iterator[list[str]]:
+    """
+    Streams the saved-words list page by page, reusing cached cookies when possible. If the
+    API rejects cached cookies, the cache is dropped and the login is retried
+    once.
+
+    With the "auto" strategy, freshly obtained cookies that the API rejects
+    (an HTTP login that looked successful but was not) are replaced by a
+    browser login.
+
+    The first page is fetched before returning so that a rejected session is
+    detected here rather than midway through enrichment.
+    """
+    logger = logging.getLogger(__name__)
+    cookies, from_cache = get_cookies(
+        config.email,
+        config.password,
+        config.cookie_cache_file,
+        use_cache=use_cookie_cache,
+        strategy=login_strategy,
+        storage_state_file=config.storage_state_file,
+    )
+    pages = iter_saved_word_pages(cookies, config.per_page_cache_file)
+    try:
+        first = next(pages, [])
+    except SessionRejectedError:
+        if from_cache:
+            logger.warning("Cached session was rejected; logging in again.")
+            retry_strategy = login_strategy
+        elif login_strategy == "auto":
+            logger.warning("New session was rejected; logging in with the browser.")
+            retry_strategy = "browser"
+        else:
+            raise
+        clear_cached_cookies(config.cookie_cache_file)
+
+        cookies, _ = get_cookies(
+            config.email,
+            config.password,
+            config.cookie_cache_file,
+            use_cache=False,
+            strategy=retry_strategy,
+            storage_state_file=config.storage_state_file,
+        )
+        pages = iter_saved_word_pages(cookies, config.per_page_cache_file)
+        first = next(pages, [])
+
+    return _chain_pages(first, pages)
+
+
+async def _write_async(
+    writer: ExportWriter | SqliteExportWriter,
+    entries: AsyncIterator[DictionaryEntry],
+) -> None:
+    async for entry in entries:
+        writer.write(entry)
 
 
 def main() -> None:
@@ -93,31 +310,98 @@ def main() -> None:
     logger = logging.getLogger(__name__)
 
     try:
-        config = load_config(output_file=args.output)
+        config = load_config(
+            output_file=args.output or default_output_file(args.format, args.compress),
+            cache_dir=args.cache_dir,
+        )
     except EnvironmentError as exc:
         logger.error(str(exc))
         sys.exit(1)
 
+    deadline = Deadline(args.deadline) if args.deadline else None
+
+    previous: list[DictionaryEntry] = []
+    incremental = args.incremental
+    if incremental:
+        try:
+            previous, complete = read_export(config.output_file, args.format, args.compress)
+        except (OSError, ValueError, KeyError, RuntimeError) as exc:
+            logger.error("Cannot read previous export %s: %s", config.output_file, exc)
+            sys.exit(1)
+        if complete:
+            logger.info("Loaded %d previously exported words.", len(previous))
+        else:
+            # Words skipped last time sit behind ones that were exported, so
+            # stopping at the first known word would never reach them.
+            logger.warning("Previous export is incomplete; running a full sync instead.")
+            previous, incremental = [], False
+    known = {entry.word for entry in previous}
+
+    cache = None if args.no_dict_cache else DictionaryCache(
+        config.dict_cache_file, args.dict_cache_ttl, redirect_stems=args.redirect_stems
+    )
+
+    mirror = sys.stdout if args.print_json else None
+    # Words still failing after their deferred retry; any make the export
+    # incomplete, so the next sync is a full pass that looks them up again.
+    failed: list[str] = []
     try:
-        cookies = login_and_get_cookies(config.email, config.password)
-        words = fetch_saved_words(cookies)
-        entries = enrich_words(words, config.api_key)
+        with open_export(config.output_file, args.format, args.compress, mirror) as writer:
+            pages = _iter_pages(
+                config,
+                use_cookie_cache=not args.fresh_login,
+                login_strategy=args.login_strategy,
+            )
+            words = words_from_pages(pages, stop_at=known if incremental else None)
+            if args.engine == "async":
+                entries = iter_enriched_async(
+                    words,
+                    config.api_key,
+                    cache,
+                    deadline=deadline,
+                    fields=args.fields,
+                    homographs=args.homographs,
+                    failed=failed,
+                )
+                asyncio.run(_write_async(writer, entries))
+            else:
+                for entry in iter_enriched(
+                    words,
+                    config.api_key,
+                    cache,
+                    deadline=deadline,
+                    fields=args.fields,
+                    homographs=args.homographs,
+                    failed=failed,
+                ):
+                    writer.write(entry)
+            for entry in previous:
+                writer.write(entry)
+            incomplete = bool(failed) or (deadline is not None and deadline.incomplete)
+            writer.finish(incomplete=incomplete)
     except RuntimeError as exc:
         logger.error(str(exc))
         sys.exit(1)
+    finally:
+        if cache is not None:
+            cache.close()
 
-    output = {
-        "total_words": len(entries),
-        "data": [entry.to_dict() for entry in entries],
-    }
-    final_json = json.dumps(output, indent=2)
-
-    with open(config.output_file, "w") as f:
-        f.write(final_json)
-    logger.info("Output saved to %s", config.output_file)
-
-    if args.print_json:
-        print(final_json)
+    if deadline is not None and deadline.incomplete:
+        logger.warning(
+            "Run deadline reached: export is partial (%d words skipped%s).",
+            deadline.skipped,
+            ", further saved words not read" if deadline.unread else "",
+        )
+    if failed:
+        logger.warning("Export is partial: %d word(s) could not be fetched.", len(failed))
+    if incomplete and args.format == "ndjson":
+        logger.warning(
+            "NDJSON exports cannot record this; run the next sync without --incremental "
+            "to pick up the missing words."
+        )
+    logger.info("Output saved to %s (%d words)", config.output_file, writer.count)
+    if cache is not None:
+        logger.info("Dictionary cache: %d hits, %d misses.", cache.hits, cache.misses)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,387 @@
+"""
+Asyncio enrichment engine: same lookups and DictionaryEntry output as
+dictionary.iter_enriched and enrich_words, driven by one event loop and an
+aiohttp connection pool instead of a thread pool with per-thread sessions.
+
+aiohttp is an optional dependency, imported only when this engine runs.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Collection, Iterable
+from typing import TYPE_CHECKING
+
+from .cache import DictionaryCache
+from .config import (
+    DEFAULT_ENTRY_FIELDS,
+    DEFAULT_HOMOGRAPH_MODE,
+    DICT_API_BASE_URL,
+    DICT_CONNECT_TIMEOUT_SECS,
+    DICT_DEFERRED_CONCURRENCY,
+    DICT_MAX_RETRIES,
+    DICT_MAX_WORKERS,
+    DICT_READ_TIMEOUT_SECS,
+    ENRICH_QUEUE_SIZE,
+)
+from .deadline import Deadline, DeadlineExceeded
+from .dictionary import (
+    _ReorderBuffer,
+    _parse_response,
+    _rate_limiter,
+    new_concurrency_limiter,
+)
+from .models import DictionaryEntry
+from .normalize import url_segment
+from .ratelimit import AdaptiveLimiter
+from .retry import TransientLookupError, backoff_delay, describe_error, is_transient_status
+
+if TYPE_CHECKING:
+    import aiohttp
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+async def _lookup(
+    http: "aiohttp.ClientSession",
+    word: str,
+    api_key: str,
+    cache: DictionaryCache | None,
+    limiter: AdaptiveLimiter,
+    deadline: Deadline | None = None,
+    fields: Collection[str] = DEFAULT_ENTRY_FIELDS,
+    homographs: str = DEFAULT_HOMOGRAPH_MODE,
+) -> list[DictionaryEntry]:
+    """
+    Async counterpart of dictionary._lookup, with the same retry, deadline
+    and caching policy; any aiohttp.ClientError other than a non-transient
+    status (e.g. a truncated body, ClientPayloadError) is retried.
+
+    Raises:
+        TransientLookupError: If the last attempt still failed transiently.
+        DeadlineExceeded: If the lookup was skipped because of the deadline.
+    """
+    import aiohttp
+
+    if cache is not None:
+        hit, response = await asyncio.to_thread(cache.get, word)
+        if hit:
+            return _parse_response(word, response, fields, homographs)
+
+    error = ""
+    for attempt in range(DICT_MAX_RETRIES + 1):
+        if deadline is not None and deadline.near():
+            raise DeadlineExceeded(f"'{word}' skipped: run deadline reached.")
+        await limiter.acquire_async()
+        try:
+            await _rate_limiter.acquire_async()
+        except BaseException:
+            limiter.abandon()
+            raise
+        # As in dictionary._lookup: re-check the deadline after both waits,
+        # and time the request, not the rate-limit wait.
+        if deadline is not None and deadline.near():
+            limiter.abandon()
+            raise DeadlineExceeded(f"'{word}' skipped: run deadline reached.")
+        started = time.monotonic()
+        status: int | None = None
+        retry_after: str | None = None
+        try:
+            async with http.get(f"{DICT_API_BASE_URL}/{url_segment(word)}", params={"key": api_key}) as resp:
+                resp.raise_for_status()
+                entries = await resp.json(content_type=None)
+        except aiohttp.ClientResponseError as exc:
+            status = exc.status
+            retry_after = exc.headers.get("Retry-After") if exc.headers else None
+            if not is_transient_status(status):
+                logger.error("HTTP error fetching '%s': %s", word, describe_error(exc, status))
+                return []
+            error = describe_error(exc, status)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as exc:
+            error = describe_error(exc)
+        except ValueError:
+            logger.error("Invalid JSON response for '%s'.", word)
+            return []
+        else:
+            if cache is not None:
+                await asyncio.to_thread(cache.put, word, entries)
+            return _parse_response(word, entries, fields, homographs)
+        finally:
+            limiter.release(time.monotonic() - started, overloaded=is_transient_status(status))
+
+        if attempt < DICT_MAX_RETRIES:
+            delay = backoff_delay(attempt, retry_after)
+            if deadline is not None and delay > deadline.remaining():
+                raise DeadlineExceeded(f"'{word}' skipped: retry would pass run deadline.")
+            logger.warning(
+                "Transient error fetching '%s' (%s); retry %d / %d in %.1f s.",
+                word, error, attempt + 1, DICT_MAX_RETRIES, delay,
+            )
+            await asyncio.sleep(delay)
+
+    raise TransientLookupError(f"'{word}' failed after {DICT_MAX_RETRIES} retries: {error}")
+
+
+async def iter_enriched_async(
+    words: Iterable[str],
+    api_key: str,
+    cache: DictionaryCache | None = None,
+    limiter: AdaptiveLimiter | None = None,
+    deadline: Deadline | None = None,
+    ordered: bool = True,
+    fields: Collection[str] = DEFAULT_ENTRY_FIELDS,
+    homographs: str = DEFAULT_HOMOGRAPH_MODE,
+    retry_deferred_last: bool | None = None,
+    failed: list[str] | None = None,
+) -> AsyncIterator[DictionaryEntry]:
+    """
+    Asyncio counterpart of dictionary.iter_enriched.
+
+    Lookups in flight are bounded by the same AIMD controller as the thread
+    engine, over one shared aiohttp connection pool of DICT_MAX_WORKERS
+    connections. words may be a lazy (blocking) iterable; each word is read
+    on an executor thread once a queue slot is free, so at most
+    ENRICH_QUEUE_SIZE words are read but not yet yielded. Cache reads and
+    writes also run on executor threads, off the event loop. Requests draw
+    from the same token bucket as the thread engine, and normalization,
+    coalescing of duplicate keys and cached inflections, ordering, retries,
+    deferred retries and the deadline behave the same way.
+
+    Args:
+        words: Words to enrich, in output order.
+        api_key: MW Dictionary API key.
+        cache: Optional persistent response cache.
+        limiter: Concurrency controller; defaults to new_concurrency_limiter().
+        deadline: Optional whole-run deadline.
+        ordered: Yield in input order (default) or in completion order.
+        fields: Entry fields to extract (see ENTRY_FIELDS).
+        homographs: "first", "split" or "merge" (see HOMOGRAPH_MODES).
+        retry_deferred_last: Retry deferred words after the main pass rather
+            than alongside it. Defaults to True when unordered.
+        failed: Receives the keys of words that still failed after their
+            deferred retry; pass a list in to find out whether the result is
+            complete.
+
+    Yields:
+        DictionaryEntry objects for successfully resolved words.
+
+    Raises:
+        RuntimeError: If aiohttp is not installed.
+    """
+    try:
+        import aiohttp
+    except ImportError as exc:
+        raise RuntimeError(
+            "The async engine requires aiohttp: pip install aiohttp"
+        ) from exc
+
+    if limiter is None:
+        limiter = new_concurrency_limiter()
+    if retry_deferred_last is None:
+        retry_deferred_last = not ordered
+    if failed is None:
+        failed = []
+    deferred_limiter = AdaptiveLimiter(
+        initial=DICT_DEFERRED_CONCURRENCY,
+        minimum=1,
+        maximum=DICT_DEFERRED_CONCURRENCY,
+    )
+    loop = asyncio.get_running_loop()
+    buffer = _ReorderBuffer(ordered)
+    slots = asyncio.Semaphore(ENRICH_QUEUE_SIZE)
+    events: asyncio.Queue[tuple[str, str, object]] = asyncio.Queue()
+    source = iter(words)
+    pending_next: asyncio.Future[tuple[object, str]] | None = None
+
+    def next_word() -> tuple[object, str]:
+        """Reads one word, and its stem-index headword key, on an executor thread."""
+        word = next(source, _END)
+        if word is _END or cache is None:
+            return word, ""
+        return word, cache.lookup_key(word)  # type: ignore[arg-type]
+
+    async def read() -> None:
+        nonlocal pending_next
+        try:
+            while True:
+                await slots.acquire()
+                pending_next = loop.run_in_executor(None, next_word)
+                word, headword_key = await asyncio.shield(pending_next)
+                if word is _END:
+                    break
+                events.put_nowait(("word", headword_key, word))
+            events.put_nowait(("end", "", None))
+        except Exception as exc:
+            events.put_nowait(("error", "", exc))
+
+    async def attempt(
+        http: aiohttp.ClientSession,
+        key: str,
+        limiter: AdaptiveLimiter,
+    ) -> tuple[list[DictionaryEntry], str]:
+        """Returns (entries, outcome) as dictionary._fetch_worker does."""
+        try:
+            result = await _lookup(
+                http, key, api_key, cache, limiter, deadline, fields, homographs
+            )
+            return result, ""
+        except TransientLookupError as exc:
+            logger.warning("Deferring %s", exc)
+            return [], "deferred"
+        except DeadlineExceeded as exc:
+            logger.info("%s", exc)
+            return [], "skipped"
+
+    tasks: set[asyncio.Task[tuple[list[DictionaryEntry], str]]] = set()
+
+    def submit(
+        http: aiohttp.ClientSession, kind: str, key: str, lookup_limiter: AdaptiveLimiter
+    ) -> None:
+        task = asyncio.create_task(attempt(http, key, lookup_limiter))
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        task.add_done_callback(lambda t: events.put_nowait((kind, key, t)))
+
+    reading = True
+    in_flight = completed = emitted = 0
+    # Deferred keys held back until the main pass ends (retry_deferred_last).
+    held: list[str] = []
+    connector = aiohttp.TCPConnector(limit=DICT_MAX_WORKERS)
+    timeout = aiohttp.ClientTimeout(
+        sock_connect=DICT_CONNECT_TIMEOUT_SECS,
+        sock_read=DICT_READ_TIMEOUT_SECS,
+    )
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as http:
+        reader = asyncio.create_task(read())
+        try:
+            while reading or in_flight or held:
+                if held and not reading and not in_flight:
+                    logger.info("Main pass done; retrying %d deferred word(s).", len(held))
+                    for held_key in held:
+                        submit(http, "retried", held_key, deferred_limiter)
+                    in_flight += len(held)
+                    held.clear()
+                kind, key, payload = await events.get()
+                if kind == "error":
+                    raise payload  # type: ignore[misc]
+                if kind == "end":
+                    reading = False
+                    continue
+                if kind == "word":
+                    if not reading:
+                        continue
+                    if deadline is not None and deadline.expired():
+                        logger.warning("Run deadline passed; not reading further words.")
+                        deadline.mark_incomplete()
+                        reading = False
+                        reader.cancel()
+                        continue
+                    key, start = buffer.add(payload, key)  # type: ignore[arg-type]
+                    if not key:
+                        slots.release()
+                    elif start:
+                        submit(http, "done", key, limiter)
+                        in_flight += 1
+                    continue
+
+                in_flight -= 1
+                result, outcome = payload.result()  # type: ignore[attr-defined]
+                if kind == "done":
+                    completed += 1
+                    logger.info("Processed word %d: %s", completed, key)
+                if outcome == "deferred" and kind == "done":
+                    if retry_deferred_last:
+                        held.append(key)
+                        continue
+                    if deadline is None or not deadline.near():
+                        submit(http, "retried", key, deferred_limiter)
+                        in_flight += 1
+                        continue
+                    logger.warning("Run deadline reached; skipping deferred word '%s'.", key)
+                    outcome = "skipped"
+                elif outcome == "deferred":
+                    failed.append(key)
+                if outcome == "skipped":
+                    deadline.skip(buffer.waiting(key))  # type: ignore[union-attr]
+                for entries in buffer.resolve(key, result):
+                    slots.release()
+                    if entries:
+                        emitted += 1
+                        for entry in entries:
+                            yield entry
+        finally:
+            reader.cancel()
+            for task in list(tasks):
+                task.cancel()
+            # Wait out a next() still running on the executor before closing
+            # the source (e.g. a streaming wordlist generator).
+            if pending_next is not None and not pending_next.done():
+                await asyncio.wait([pending_next])
+            close = getattr(words, "close", None)
+            if close is not None:
+                close()
+
+    if failed:
+        logger.error(
+            "%d word(s) could not be fetched and are missing from the export: %s",
+            len(failed), ", ".join(failed),
+        )
+    logger.info(
+        "Enriched %d / %d words with %d lookups (%d duplicates coalesced, "
+        "%d inflections via the stem index).",
+        emitted, buffer.words, buffer.lookups, buffer.words - buffer.lookups,
+        buffer.inflections,
+    )
+    logger.info(
+        "Concurrency limit: final %d, peak %d, %d decrease(s).",
+        limiter.limit, limiter.peak_limit, limiter.decreases,
+    )
+
+
+async def enrich_words_async(
+    words: Iterable[str],
+    api_key: str,
+    cache: DictionaryCache | None = None,
+    limiter: AdaptiveLimiter | None = None,
+    deadline: Deadline | None = None,
+    fields: Collection[str] = DEFAULT_ENTRY_FIELDS,
+    homographs: str = DEFAULT_HOMOGRAPH_MODE,
+    failed: list[str] | None = None,
+) -> list[DictionaryEntry]:
+    """
+    Asyncio counterpart of dictionary.enrich_words: collects
+    iter_enriched_async into a list, retrying deferred words after the main
+    pass.
+
+    Args:
+        words: Words to enrich, in output order.
+        api_key: MW Dictionary API key.
+        cache: Optional persistent response cache.
+        limiter: Concurrency controller; defaults to new_concurrency_limiter().
+        deadline: Optional whole-run deadline.
+        fields: Entry fields to extract (see ENTRY_FIELDS).
+        homographs: "first", "split" or "merge" (see HOMOGRAPH_MODES).
+        failed: Receives the keys of words that could not be fetched (see
+            dictionary.iter_enriched).
+
+    Returns:
+        List of DictionaryEntry objects for successfully resolved words,
+        in the same order as the input.
+
+    Raises:
+        RuntimeError: If aiohttp is not installed.
+    """
+    entries = iter_enriched_async(
+        words,
+        api_key,
+        cache,
+        limiter,
+        deadline,
+        fields=fields,
+        homographs=homographs,
+        retry_deferred_last=True,
+        failed=failed,
+    )
+    return [entry async for entry in entries]
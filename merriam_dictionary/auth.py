@@ -1,13 +1,261 @@
 import logging
+import time
+from html.parser import HTMLParser
+from urllib.parse import urljoin
 
-from playwright.sync_api import TimeoutError as PlaywrightTimeoutError, sync_playwright
+import requests
+from playwright.sync_api import (
+    BrowserContext,
+    Error as PlaywrightError,
+    Page,
+    Request,
+    Route,
+    TimeoutError as PlaywrightTimeoutError,
+    sync_playwright,
+)
 
-from .config import LOGIN_TIMEOUT_MS, LOGIN_URL, PAGE_LOAD_TIMEOUT_MS, SAVED_WORDS_URL
+from .config import (
+    BASE_URL,
+    COOKIE_CACHE_MAX_AGE_SECS,
+    COOKIE_POLL_INTERVAL_MS,
+    DEFAULT_LOGIN_STRATEGY,
+    HTTP_LOGIN_TIMEOUT_SECS,
+    LOGIN_ALLOWED_RESOURCE_TYPES,
+    LOGIN_BLOCKED_URL_SUBSTRINGS,
+    LOGIN_TIMEOUT_MS,
+    LOGIN_URL,
+    PAGE_LOAD_TIMEOUT_MS,
+    SAVED_WORDS_URL,
+)
+from .storage import read_json, remove_file, write_private_json
 
 logger = logging.getLogger(__name__)
 
+_EMAIL_FIELD_ID = "ul-email"
+_PASSWORD_FIELD_ID = "ul-password"
 
-def login_and_get_cookies(email: str, password: str) -> list[dict]:
+
+def login_and_get_cookies(
+    email: str,
+    password: str,
+    strategy: str = DEFAULT_LOGIN_STRATEGY,
+    storage_state_file: str | None = None,
+) -> list[dict]:
+    """
+    Logs in to Merriam-Webster and returns session cookies for use with
+    downstream HTTP requests.
+
+    Strategies:
+        http     Submit the login form directly with requests — no browser.
+        browser  Drive headless Chromium through the login page.
+        auto     Try http first and fall back to browser if it fails.
+
+    Args:
+        email: Merriam-Webster account email.
+        password: Merriam-Webster account password.
+        strategy: One of "auto", "http" or "browser".
+        storage_state_file: Where the browser strategy persists its storage
+            state between runs. None disables persistence.
+
+    Returns:
+        A list of cookie dicts in Playwright's context.cookies() shape.
+
+    Raises:
+        RuntimeError: If login fails with the selected strategy.
+        ValueError: If strategy is not recognised.
+    """
+    if strategy == "browser":
+        return _login_with_browser(email, password, storage_state_file)
+    if strategy == "http":
+        return _login_with_http(email, password)
+    if strategy != "auto":
+        raise ValueError(f"Unknown login strategy: {strategy!r}")
+
+    try:
+        return _login_with_http(email, password)
+    except (RuntimeError, requests.RequestException) as exc:
+        logger.warning("Direct HTTP login failed (%s); falling back to browser.", exc)
+        return _login_with_browser(email, password, storage_state_file)
+
+
+class _LoginFormParser(HTMLParser):
+    """Collects the action and input fields of the form holding the email input."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.action: str | None = None
+        self.fields: dict[str, str] = {}
+        self.email_name: str | None = None
+        self.password_name: str | None = None
+        self._in_form = False
+        self._form_action: str = ""
+        self._form_fields: dict[str, str] = {}
+        self._form_ids: dict[str, str] = {}
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attr = {key: value or "" for key, value in attrs}
+        if tag == "form":
+            self._in_form = True
+            self._form_action = attr.get("action", "")
+            self._form_fields = {}
+            self._form_ids = {}
+        elif tag == "input" and self._in_form and attr.get("name"):
+            self._form_fields[attr["name"]] = attr.get("value", "")
+            if attr.get("id"):
+                self._form_ids[attr["id"]] = attr["name"]
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag != "form" or not self._in_form:
+            return
+        self._in_form = False
+        if _EMAIL_FIELD_ID in self._form_ids and self.action is None:
+            self.action = self._form_action
+            self.fields = self._form_fields
+            self.email_name = self._form_ids[_EMAIL_FIELD_ID]
+            self.password_name = self._form_ids.get(_PASSWORD_FIELD_ID)
+
+
+def _to_cookie_dicts(jar: requests.cookies.RequestsCookieJar) -> list[dict]:
+    """Converts a requests cookie jar into Playwright's cookie dict shape."""
+    return [
+        {
+            "name": cookie.name,
+            "value": cookie.value,
+            "domain": cookie.domain,
+            "path": cookie.path,
+            "expires": float(cookie.expires) if cookie.expires is not None else -1,
+            "httpOnly": cookie.has_nonstandard_attr("HttpOnly"),
+            "secure": bool(cookie.secure),
+        }
+        for cookie in jar
+    ]
+
+
+def _login_with_http(email: str, password: str) -> list[dict]:
+    """
+    Logs in by fetching /login, replaying its form (including hidden fields
+    such as CSRF tokens) as a plain POST, and collecting the resulting cookies.
+
+    The GET of /login already sets anonymous cookies, so success requires
+    the POST to set at least one cookie that was not present before it.
+
+    Raises:
+        RuntimeError: If the form cannot be found, or the POST does not leave
+            the login page or set a new session cookie.
+    """
+    session = requests.Session()
+    logger.info("Fetching login form over HTTP...")
+    resp = session.get(LOGIN_URL, timeout=HTTP_LOGIN_TIMEOUT_SECS)
+    resp.raise_for_status()
+
+    parser = _LoginFormParser()
+    parser.feed(resp.text)
+    if parser.action is None or not parser.email_name or not parser.password_name:
+        raise RuntimeError("Login form not found in /login page.")
+
+    payload = dict(parser.fields)
+    payload[parser.email_name] = email
+    payload[parser.password_name] = password
+    action_url = urljoin(resp.url, parser.action or resp.url)
+    anonymous = {(cookie.name, cookie.domain) for cookie in session.cookies}
+
+    resp = session.post(
+        action_url,
+        data=payload,
+        headers={"referer": LOGIN_URL},
+        timeout=HTTP_LOGIN_TIMEOUT_SECS,
+    )
+    resp.raise_for_status()
+    if "/login" in resp.url:
+        raise RuntimeError("Login form POST did not redirect away from /login.")
+
+    if all((cookie.name, cookie.domain) in anonymous for cookie in session.cookies):
+        raise RuntimeError("Login form POST set no new session cookie.")
+    cookies = _to_cookie_dicts(session.cookies)
+    logger.info("Logged in over HTTP; extracted %d cookies.", len(cookies))
+    return cookies
+
+
+class _TrafficStats:
+    """Counts requests the browser completed or aborted during login."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.blocked = 0
+        self.bytes = 0
+
+    def on_route(self, route: Route) -> None:
+        request = route.request
+        if request.resource_type not in LOGIN_ALLOWED_RESOURCE_TYPES or any(
+            blocked in request.url for blocked in LOGIN_BLOCKED_URL_SUBSTRINGS
+        ):
+            self.blocked += 1
+            route.abort()
+        else:
+            route.continue_()
+
+    def on_request_finished(self, request: Request) -> None:
+        self.requests += 1
+        try:
+            sizes = request.sizes()
+        except PlaywrightError:
+            return
+        self.bytes += sum(sizes.values())
+
+
+def _wait_for_session_cookies(context: BrowserContext, page: Page) -> list[dict]:
+    """
+    Polls the context until cookies for the MW domain are present and have
+    stopped changing between two polls — the login redirect's Set-Cookie
+    headers have then all been applied, without loading another page.
+    """
+    deadline = time.monotonic() + LOGIN_TIMEOUT_MS / 1000
+    previous: list[dict] = []
+    while True:
+        cookies = context.cookies(BASE_URL)
+        if cookies and cookies == previous:
+            return context.cookies()
+        if time.monotonic() > deadline:
+            raise PlaywrightTimeoutError("Timed out waiting for session cookies.")
+        previous = cookies
+        page.wait_for_timeout(COOKIE_POLL_INTERVAL_MS)
+
+
+def _restore_browser_session(page: Page) -> bool:
+    """
+    Loads /saved-words with the restored storage state. Returns True if the
+    page stays put, False if MW redirects to /login (session expired).
+    """
+    logger.info("Checking saved browser session...")
+    page.goto(SAVED_WORDS_URL, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT_MS)
+    if "/login" in page.url:
+        logger.info("Saved browser session has expired.")
+        return False
+    logger.info("Saved browser session is still authenticated; skipping login form.")
+    return True
+
+
+def _submit_login_form(page: Page, email: str, password: str) -> None:
+    logger.info("Navigating to login page...")
+    page.goto(LOGIN_URL, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT_MS)
+
+    page.fill("#ul-email", email)
+    page.fill("#ul-password", password)
+    page.click("#ul-login")
+
+    # Wait for redirect away from /login — indicates successful auth.
+    page.wait_for_url(
+        lambda url: "/login" not in url,
+        timeout=LOGIN_TIMEOUT_MS,
+    )
+    logger.info("Logged in successfully.")
+
+
+def _login_with_browser(
+    email: str,
+    password: str,
+    storage_state_file: str | None = None,
+) -> list[dict]:
     """
     Launches a headless Chromium browser, logs in to Merriam-Webster, and returns
     session cookies for use with downstream HTTP requests.
@@ -16,9 +264,17 @@ def login_and_get_cookies(email: str, password: str) -> list[dict]:
     plain requests.Session loaded with these cookies — no browser needed for
     pagination or dictionary lookups.
 
+    Resource types outside LOGIN_ALLOWED_RESOURCE_TYPES and known ad/analytics
+    hosts are aborted, and wall-clock time and bytes transferred are logged.
+
+    When storage_state_file exists, the context is restored from it and the
+    login form is skipped if /saved-words loads without redirecting to /login.
+    The context's storage state is written back after every successful call.
+
     Args:
         email: Merriam-Webster account email.
         password: Merriam-Webster account password.
+        storage_state_file: Path of the persisted storage state, or None.
 
     Returns:
         A list of cookie dicts from the authenticated browser context.
@@ -26,31 +282,36 @@ def login_and_get_cookies(email: str, password: str) -> list[dict]:
     Raises:
         RuntimeError: If login times out or fails.
     """
+    started = time.perf_counter()
+    stats = _TrafficStats()
+
     with sync_playwright() as p:
         browser = p.chromium.launch(headless=True)
-        context = browser.new_context()
+        restore = read_json(storage_state_file) if storage_state_file else None
+        if not isinstance(restore, dict):
+            restore = None
+        context = browser.new_context(storage_state=restore)
+        context.route("**/*", stats.on_route)
+        context.on("requestfinished", stats.on_request_finished)
         page = context.new_page()
 
         try:
-            logger.info("Navigating to login page...")
-            page.goto(LOGIN_URL, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT_MS)
-
-            page.fill("#ul-email", email)
-            page.fill("#ul-password", password)
-            page.click("#ul-login")
+            if restore and _restore_browser_session(page):
+                cookies = context.cookies()
+            else:
+                _submit_login_form(page, email, password)
+                cookies = _wait_for_session_cookies(context, page)
 
-            # Wait for redirect away from /login — indicates successful auth.
-            page.wait_for_url(
-                lambda url: "/login" not in url,
-                timeout=LOGIN_TIMEOUT_MS,
-            )
-            logger.info("Logged in successfully.")
-
-            # Navigate to saved-words to ensure all session cookies are fully set.
-            page.goto(SAVED_WORDS_URL, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT_MS)
-
-            cookies = context.cookies()
+            if storage_state_file:
+                write_private_json(storage_state_file, context.storage_state())
             logger.info("Extracted %d cookies from browser session.", len(cookies))
+            logger.info(
+                "Browser login took %.2f s: %d requests, %d blocked, %.1f KiB transferred.",
+                time.perf_counter() - started,
+                stats.requests,
+                stats.blocked,
+                stats.bytes / 1024,
+            )
             return cookies
 
         except PlaywrightTimeoutError as exc:
@@ -60,3 +321,74 @@ def login_and_get_cookies(email: str, password: str) -> list[dict]:
 
         finally:
             browser.close()
+
+
+def load_cached_cookies(path: str) -> list[dict] | None:
+    """
+    Loads cookies saved by save_cookies() if the cache is still usable.
+
+    Individually expired cookies are dropped. The whole cache is treated as
+    expired once it is older than COOKIE_CACHE_MAX_AGE_SECS, since session
+    cookies (expires == -1) carry no expiry of their own.
+
+    Returns:
+        The cached cookie list, or None if the cache is missing or expired.
+    """
+    cached = read_json(path)
+    if not isinstance(cached, dict) or not isinstance(cached.get("cookies"), list):
+        return None
+
+    now = time.time()
+    age = now - float(cached.get("saved_at", 0))
+    if age > COOKIE_CACHE_MAX_AGE_SECS:
+        logger.info("Cookie cache is %.0f s old; ignoring it.", age)
+        return None
+
+    cookies = [
+        cookie
+        for cookie in cached["cookies"]
+        if cookie.get("expires", -1) == -1 or cookie["expires"] > now
+    ]
+    if not cookies:
+        logger.info("All cached cookies have expired.")
+        return None
+
+    logger.info("Loaded %d cookies from cache (%.0f s old).", len(cookies), age)
+    return cookies
+
+
+def save_cookies(path: str, cookies: list[dict]) -> None:
+    """Persists cookies with a timestamp to a user-only (0600) JSON file."""
+    write_private_json(path, {"saved_at": time.time(), "cookies": cookies})
+    logger.info("Saved %d cookies to %s", len(cookies), path)
+
+
+def clear_cached_cookies(path: str) -> None:
+    """Removes the cookie cache, forcing the next run to log in."""
+    remove_file(path)
+
+
+def get_cookies(
+    email: str,
+    password: str,
+    cache_file: str,
+    use_cache: bool = True,
+    strategy: str = DEFAULT_LOGIN_STRATEGY,
+    storage_state_file: str | None = None,
+) -> tuple[list[dict], bool]:
+    """
+    Returns session cookies from the local cache when valid, otherwise logs in
+    with the given strategy and refreshes the cache.
+
+    Returns:
+        A (cookies, from_cache) tuple. from_cache tells the caller whether a
+        rejection by the API should be answered with a fresh login.
+    """
+    if use_cache:
+        cookies = load_cached_cookies(cache_file)
+        if cookies:
+            return cookies, True
+
+    cookies = login_and_get_cookies(email, password, strategy, storage_state_file)
+    save_cookies(cache_file, cookies)
+    return cookies, False
@@ -0,0 +1,169 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+from .config import DICT_API_REFERENCE, DICT_CACHE_TTL_SECS
+from .normalize import entry_headword, normalize_word
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    ref        TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    response   TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (ref, key)
+);
+CREATE TABLE IF NOT EXISTS stems (
+    ref        TEXT NOT NULL,
+    stem       TEXT NOT NULL,
+    key        TEXT NOT NULL,
+    PRIMARY KEY (ref, stem)
+);
+"""
+
+# PRAGMA user_version of a cache migrated by this version (see _migrate).
+_SCHEMA_VERSION = 1
+
+
+def _response_stems(response: object) -> set[str]:
+    """
+    Normalized meta.stems of the response's first entry. Later homographs
+    are left out: their stems include forms that are headwords of their own
+    ("bore" and "born" under bear:2). The first entry's stems can still
+    include such forms ("left" under leave:1, "saw" under see:1, "found"
+    under find:1, "lay" under lie:1), which is why redirecting is opt-in.
+    """
+    if not isinstance(response, list) or not response or not entry_headword(response[0]):
+        return set()
+    return {normalize_word(stem) for stem in response[0]["meta"].get("stems", [])}
+
+
+class DictionaryCache:
+    """
+    Persistent SQLite cache of raw dictionary API responses, keyed by API
+    reference and normalized word.
+
+    Responses are stored as returned, not as parsed entries, so a cached
+    lookup can serve any field selection (see config.ENTRY_FIELDS) and
+    every homograph in the response. "Not found" answers are cached too, so
+    unknown words don't cost a request on every run. Transient failures are
+    never cached. Caches written by earlier versions are migrated once on
+    open, tracked by PRAGMA user_version.
+
+    The stems table indexes every inflection listed in the meta.stems of a
+    cached response's first entry ("ran", "running", "runs") against the key it was cached
+    under. With redirect_stems, lookup_key sends an inflection to its
+    headword's response instead of the API. That is off by default, since
+    meta.stems also lists words with entries of their own ("left" under
+    leave:1, "saw" under see:1), which would then be exported as the
+    headword. The index is kept either way.
+    The database runs in WAL mode and is shared by all worker threads through
+    one connection guarded by a lock.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_secs: float = DICT_CACHE_TTL_SECS,
+        reference: str = DICT_API_REFERENCE,
+        redirect_stems: bool = False,
+    ) -> None:
+        os.makedirs(os.path.dirname(path) or ".", mode=0o700, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._ttl_secs = ttl_secs
+        self._reference = reference
+        self.redirect_stems = redirect_stems
+        self.hits = 0
+        self.misses = 0
+        self._migrate()
+
+    def _migrate(self) -> None:
+        """
+        Brings a cache written by an earlier version up to _SCHEMA_VERSION,
+        one step per version:
+
+          1. drops the "entries" table of parsed results and indexes the
+             stems of responses cached before the stems table existed.
+        """
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _SCHEMA_VERSION:
+            return
+        if version < 1:
+            self._conn.execute("DROP TABLE IF EXISTS entries")
+            rows = self._conn.execute("SELECT ref, key, response FROM responses").fetchall()
+            for ref, key, payload in rows:
+                self._index_stems(ref, key, json.loads(payload))
+            if rows:
+                logger.info("Indexed stems of %d cached dictionary responses.", len(rows))
+        self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.commit()
+
+    def _index_stems(self, ref: str, key: str, response: object) -> None:
+        # First writer wins; a word cached under its own key takes precedence
+        # in lookup_key regardless.
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO stems (ref, stem, key) VALUES (?, ?, ?)",
+            [(ref, stem, key) for stem in _response_stems(response) if stem != key],
+        )
+
+    def lookup_key(self, word: str) -> str:
+        """
+        Returns the cache key to look word up under: its own normalized key,
+        unless redirect_stems is set, word is not cached under it and a
+        cached response lists word among its stems, in which case that
+        response's key.
+        """
+        key = normalize_word(word)
+        if not self.redirect_stems:
+            return key
+        with self._lock:
+            if self._conn.execute(
+                "SELECT 1 FROM responses WHERE ref = ? AND key = ?", (self._reference, key)
+            ).fetchone() is not None:
+                return key
+            row = self._conn.execute(
+                "SELECT key FROM stems WHERE ref = ? AND stem = ?", (self._reference, key)
+            ).fetchone()
+        return row[0] if row is not None else key
+
+    def get(self, word: str) -> tuple[bool, object]:
+        """
+        Returns (hit, response): on a hit, the decoded API response for word.
+        Expired rows count as misses.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, fetched_at FROM responses WHERE ref = ? AND key = ?",
+                (self._reference, normalize_word(word)),
+            ).fetchone()
+            if row is None or time.time() - row[1] > self._ttl_secs:
+                self.misses += 1
+                return False, None
+            self.hits += 1
+        return True, json.loads(row[0])
+
+    def put(self, word: str, response: object) -> None:
+        """Stores a decoded API response stamped with the current time and indexes its stems."""
+        key = normalize_word(word)
+        payload = json.dumps(response, separators=(",", ":"))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (ref, key, response, fetched_at) VALUES (?, ?, ?, ?)",
+                (self._reference, key, payload, time.time()),
+            )
+            self._index_stems(self._reference, key, response)
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -8,31 +8,158 @@ BASE_URL = "https://www.merriam-webster.com"
 LOGIN_URL = f"{BASE_URL}/login"
 SAVED_WORDS_URL = f"{BASE_URL}/saved-words"
 WORDLIST_API_URL = f"{BASE_URL}/lapi/v1/wordlist/search"
-DICT_API_BASE_URL = "https://dictionaryapi.com/api/v3/references/sd3/json"
+DICTIONARY_URL = f"{BASE_URL}/dictionary"
+DICT_API_REFERENCE = "sd3"
+DICT_API_BASE_URL = f"https://dictionaryapi.com/api/v3/references/{DICT_API_REFERENCE}/json"
 
 # ---------------------------------------------------------------------------
 # Playwright timeouts (milliseconds)
 # ---------------------------------------------------------------------------
 PAGE_LOAD_TIMEOUT_MS: int = 15_000
 LOGIN_TIMEOUT_MS: int = 15_000
+# How often to poll the context for cookies after the login redirect.
+COOKIE_POLL_INTERVAL_MS: int = 100
+
+# ---------------------------------------------------------------------------
+# Browser login resource filtering
+# ---------------------------------------------------------------------------
+# Playwright resource types the login flow needs; all others (image, font,
+# stylesheet, media, ...) are aborted before they hit the network.
+LOGIN_ALLOWED_RESOURCE_TYPES: frozenset[str] = frozenset(
+    {"document", "script", "xhr", "fetch"}
+)
+# Ad and analytics hosts whose scripts are aborted even though scripts are allowed.
+LOGIN_BLOCKED_URL_SUBSTRINGS: tuple[str, ...] = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "amazon-adsystem.com",
+    "adnxs.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "facebook.net",
+)
+
+# ---------------------------------------------------------------------------
+# HTTP timeouts (seconds): (connect, read) per endpoint
+# ---------------------------------------------------------------------------
+WORDLIST_CONNECT_TIMEOUT_SECS: float = 5.0
+WORDLIST_READ_TIMEOUT_SECS: float = 30.0
+DICT_CONNECT_TIMEOUT_SECS: float = 5.0
+DICT_READ_TIMEOUT_SECS: float = 15.0
+# With --deadline, new lookups stop this long before the deadline so that
+# requests already in flight can still finish within their timeouts.
+DEADLINE_MARGIN_SECS: float = DICT_CONNECT_TIMEOUT_SECS + DICT_READ_TIMEOUT_SECS
+
+# ---------------------------------------------------------------------------
+# Login strategy
+# ---------------------------------------------------------------------------
+LOGIN_STRATEGIES: tuple[str, ...] = ("auto", "http", "browser")
+DEFAULT_LOGIN_STRATEGY: str = "auto"
+HTTP_LOGIN_TIMEOUT_SECS: float = 15.0
 
 # ---------------------------------------------------------------------------
 # Pagination
 # ---------------------------------------------------------------------------
+# Fallback page size, used when the perPage probe fails.
 WORDS_PER_PAGE: int = 16
+# perPage values probed (largest first) to find what the wordlist API honours.
+WORDS_PER_PAGE_CANDIDATES: tuple[int, ...] = (1000, 250, 100, 50)
+PER_PAGE_CACHE_TTL_SECS: int = 7 * 24 * 60 * 60
+
+# ---------------------------------------------------------------------------
+# Courtesy rate limits for outbound requests (token buckets shared by all
+# threads: sustained requests/second and the burst allowed after idling)
+# ---------------------------------------------------------------------------
+WORDLIST_RATE_PER_SEC: float = 2.0
+WORDLIST_RATE_BURST: int = 2
+WORDLIST_MAX_WORKERS: int = 4
+DICT_RATE_PER_SEC: float = 10.0
+DICT_RATE_BURST: int = 10
 
 # ---------------------------------------------------------------------------
-# Courtesy delays between outbound requests (seconds)
+# Dictionary lookup concurrency (adapted at runtime by an AIMD controller;
+# DICT_MAX_WORKERS is the ceiling and the size of the thread pool)
 # ---------------------------------------------------------------------------
-WORDLIST_DELAY_SECS: float = 0.5
-DICT_DELAY_SECS: float = 0.3
-DICT_MAX_WORKERS: int = 10
+DICT_CONCURRENCY_INITIAL: int = 4
+DICT_CONCURRENCY_MIN: int = 1
+DICT_MAX_WORKERS: int = 32
+
+# ---------------------------------------------------------------------------
+# Retries (connection errors, timeouts, 429 and 5xx)
+# ---------------------------------------------------------------------------
+DICT_MAX_RETRIES: int = 3
+RETRY_BASE_DELAY_SECS: float = 0.5
+RETRY_MAX_DELAY_SECS: float = 30.0
+# Words still failing after their retries are tried once more by a separate
+# pool of this many workers: alongside the main pass for ordered streams (so
+# one failing word doesn't hold up the words behind it), after it otherwise.
+DICT_DEFERRED_CONCURRENCY: int = 2
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+# Words buffered between wordlist pagination and dictionary enrichment, and
+# the cap on lookups queued in the pool; pagination blocks beyond this.
+ENRICH_QUEUE_SIZE: int = 100
+# "thread": ThreadPoolExecutor + requests; "async": asyncio + aiohttp (optional).
+ENRICH_ENGINES: tuple[str, ...] = ("thread", "async")
+DEFAULT_ENRICH_ENGINE: str = "thread"
+
+# ---------------------------------------------------------------------------
+# Entry fields
+# ---------------------------------------------------------------------------
+# Fields a lookup can extract; only requested ones are parsed and exported.
+# "description" is the first shortdef; the rest walk further into the entry.
+ENTRY_FIELDS: tuple[str, ...] = (
+    "description",
+    "examples",
+    "pronunciations",
+    "functional_label",
+    "etymology",
+    "stems",
+    "offensive",
+)
+DEFAULT_ENTRY_FIELDS: tuple[str, ...] = ("description", "examples")
+# Homographs (entries sharing the headword, e.g. "bear:1" noun, "bear:2"
+# verb): "first" keeps the first entry only, "split" exports one record per
+# homograph, "merge" combines them into one multi-sense record.
+HOMOGRAPH_MODES: tuple[str, ...] = ("first", "split", "merge")
+DEFAULT_HOMOGRAPH_MODE: str = "first"
+
+# ---------------------------------------------------------------------------
+# Export
+# ---------------------------------------------------------------------------
+# "json": indented document; "compact": same without whitespace;
+# "ndjson": one entry per line; "sqlite": upserted tables with an FTS5 index.
+EXPORT_FORMATS: tuple[str, ...] = ("json", "compact", "ndjson", "sqlite")
+DEFAULT_EXPORT_FORMAT: str = "json"
+# "zstd" needs the optional zstandard package.
+EXPORT_COMPRESSIONS: tuple[str, ...] = ("none", "gzip", "zstd")
+DEFAULT_EXPORT_COMPRESSION: str = "none"
 
 # ---------------------------------------------------------------------------
 # Defaults
 # ---------------------------------------------------------------------------
-DEFAULT_OUTPUT_FILE: str = "dictionary_output.json"
+# The default output file is this stem plus a format/compression extension.
+DEFAULT_OUTPUT_STEM: str = "dictionary_output"
+DEFAULT_OUTPUT_FILE: str = DEFAULT_OUTPUT_STEM + ".json"
 DEFAULT_LOG_FILE: str = "dictionary_scrape.log"
+DEFAULT_CACHE_DIR: str = os.path.join(os.path.expanduser("~"), ".cache", "merriam_dictionary")
+
+# ---------------------------------------------------------------------------
+# Local state (files live under the cache directory)
+# ---------------------------------------------------------------------------
+COOKIE_CACHE_FILENAME: str = "cookies.json"
+# Session cookies carry no expiry of their own; cap how long they are trusted.
+COOKIE_CACHE_MAX_AGE_SECS: int = 12 * 60 * 60
+# Playwright storage_state (cookies + localStorage) reloaded by the browser login.
+STORAGE_STATE_FILENAME: str = "storage_state.json"
+PER_PAGE_CACHE_FILENAME: str = "wordlist_per_page.json"
+DICT_CACHE_FILENAME: str = "dictionary_cache.sqlite3"
+# Definitions rarely change; cached lookups are reused for this long.
+DICT_CACHE_TTL_SECS: int = 30 * 24 * 60 * 60
 
 
 @dataclass(frozen=True)
@@ -42,11 +169,29 @@ class AppConfig:
     api_key: str
     output_file: str = DEFAULT_OUTPUT_FILE
     log_file: str | None = DEFAULT_LOG_FILE
+    cache_dir: str = DEFAULT_CACHE_DIR
+
+    @property
+    def cookie_cache_file(self) -> str:
+        return os.path.join(self.cache_dir, COOKIE_CACHE_FILENAME)
+
+    @property
+    def storage_state_file(self) -> str:
+        return os.path.join(self.cache_dir, STORAGE_STATE_FILENAME)
+
+    @property
+    def per_page_cache_file(self) -> str:
+        return os.path.join(self.cache_dir, PER_PAGE_CACHE_FILENAME)
+
+    @property
+    def dict_cache_file(self) -> str:
+        return os.path.join(self.cache_dir, DICT_CACHE_FILENAME)
 
 
 def load_config(
     output_file: str = DEFAULT_OUTPUT_FILE,
     log_file: str | None = DEFAULT_LOG_FILE,
+    cache_dir: str = DEFAULT_CACHE_DIR,
 ) -> AppConfig:
     """
     Reads required credentials from environment variables and returns an AppConfig.
@@ -71,4 +216,5 @@ def load_config(
         api_key=env["DICT_API_KEY"],  # type: ignore[arg-type]
         output_file=output_file,
         log_file=log_file,
+        cache_dir=cache_dir,
     )
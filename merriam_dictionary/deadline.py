@@ -0,0 +1,51 @@
+import threading
+import time
+
+from .config import DEADLINE_MARGIN_SECS
+
+
+class DeadlineExceeded(RuntimeError):
+    """Raised when a lookup is skipped because the run deadline is near."""
+
+
+class Deadline:
+    """
+    Whole-run deadline shared by the scheduler and its caller.
+
+    near() turns true DEADLINE_MARGIN_SECS before the deadline — enough for a
+    request started just before then to finish within its timeouts. From
+    then on only cached words can be answered; input is still read until
+    expired(), the deadline itself. Words dropped because of the deadline are
+    recorded with skip(), and input left unread with mark_incomplete(); both
+    mark the run incomplete so the caller can flag its export.
+    """
+
+    def __init__(self, seconds: float, margin: float = DEADLINE_MARGIN_SECS) -> None:
+        self._expires_at = time.monotonic() + seconds
+        self._margin = margin
+        self._lock = threading.Lock()
+        self.skipped = 0
+        self.unread = False
+        self.incomplete = False
+
+    def remaining(self) -> float:
+        """Seconds left before the scheduler must stop starting requests."""
+        return self._expires_at - self._margin - time.monotonic()
+
+    def near(self) -> bool:
+        return self.remaining() <= 0
+
+    def expired(self) -> bool:
+        """True once the deadline itself has passed."""
+        return time.monotonic() >= self._expires_at
+
+    def skip(self, count: int = 1) -> None:
+        """Records words left out of the export because of the deadline."""
+        with self._lock:
+            self.skipped += count
+            self.incomplete = True
+
+    def mark_incomplete(self) -> None:
+        """Records that input was left unread because of the deadline."""
+        self.unread = True
+        self.incomplete = True
@@ -1,17 +1,41 @@
 import logging
-import re
+import queue
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections.abc import Collection, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import cached_property
 
 import requests
 
-from .config import DICT_API_BASE_URL, DICT_DELAY_SECS, DICT_MAX_WORKERS
+from .cache import DictionaryCache
+from .config import (
+    DEFAULT_ENTRY_FIELDS,
+    DEFAULT_HOMOGRAPH_MODE,
+    DICT_API_BASE_URL,
+    DICT_CONCURRENCY_INITIAL,
+    DICT_CONCURRENCY_MIN,
+    DICT_CONNECT_TIMEOUT_SECS,
+    DICT_DEFERRED_CONCURRENCY,
+    DICT_MAX_RETRIES,
+    DICT_MAX_WORKERS,
+    DICT_RATE_BURST,
+    DICT_RATE_PER_SEC,
+    DICT_READ_TIMEOUT_SECS,
+    ENRICH_QUEUE_SIZE,
+)
+from .deadline import Deadline, DeadlineExceeded
+from .markup import render, render_text
 from .models import DictionaryEntry
+from .normalize import entry_headword, normalize_word, url_segment
+from .ratelimit import AdaptiveLimiter, TokenBucket
+from .retry import TransientLookupError, backoff_delay, describe_error, is_transient_status
 
 logger = logging.getLogger(__name__)
 
 _thread_local = threading.local()
+_rate_limiter = TokenBucket(DICT_RATE_PER_SEC, DICT_RATE_BURST)
 
 
 def _get_session() -> requests.Session:
@@ -19,50 +43,76 @@ def _get_session() -> requests.Session:
         _thread_local.session = requests.Session()
     return _thread_local.session
 
-# Matches all MW API inline formatting tags: {it}, {/it}, {b}, {sc}, etc.
-_FORMATTING_TAGS = re.compile(r"\{/?[a-z_]+\}")
-
-
-def _strip_formatting(text: str) -> str:
-    """Remove MW API inline formatting tags from example text."""
-    return _FORMATTING_TAGS.sub("", text)
-
 
 def _parse_examples(entry: dict) -> list[str]:
     """
-    Extract unique example sentences from the nested def/sseq/dt/vis structure
-    of a Merriam-Webster API entry.
+    Extract unique example sentences from a Merriam-Webster API entry, in
+    document order, without recursion:
 
-    The MW response nests examples several levels deep:
-      entry["def"] -> sseq -> sense_group -> sense_entry -> dt -> vis -> t
-    """
-    examples: list[str] = []
+      def -> sseq -> sense group -> sense container -> dt -> vis -> t
 
-    for def_block in entry.get("def", []):
-        for sense_group in def_block.get("sseq", []):
-            for sense_entry in sense_group:
-                # Each sense_entry is [sense_type, sense_info_dict]
-                if len(sense_entry) < 2 or not isinstance(sense_entry[1], dict):
+    Sense containers are "sense"/"sen", "bs" (binding substitute, data under
+    "sense") and "pseq" (a sequence of sense and bs containers); a sense may
+    carry a divided sense, "sdsense". Within dt, examples come from "vis"
+    and from the dt-like lists nested in "uns" usage notes and "snote"
+    supplemental notes. Malformed nodes (short lists, non-dict senses) are
+    skipped, since a cached response would otherwise fail every run.
+
+    Markup is rendered to plain text (see markup.render_text). Duplicates are
+    dropped in first-seen order through a dict, in linear time.
+    """
+    examples: dict[str, None] = {}
+    for block in entry.get("def", ()):
+        for group in block.get("sseq", ()):
+            for container in group:
+                if len(container) < 2:
                     continue
-                for dt_item in sense_entry[1].get("dt", []):
-                    if not dt_item or dt_item[0] != "vis":
+                # A pseq is walked in place; anything else is one container.
+                members = container[1] if container[0] == "pseq" else (container,)
+                for member in members:
+                    if len(member) < 2:
                         continue
-                    for ex in dt_item[1]:
-                        text = _strip_formatting(ex.get("t", "")).strip()
-                        if text and text not in examples:
-                            examples.append(text)
-
-    return examples
+                    container_type, sense = member[0], member[1]
+                    if container_type == "bs":
+                        sense = sense.get("sense") if isinstance(sense, dict) else None
+                    elif container_type != "sense" and container_type != "sen":
+                        continue
+                    while isinstance(sense, dict):
+                        for item in sense.get("dt", ()):
+                            if len(item) < 2:
+                                continue
+                            label = item[0]
+                            if label == "vis":
+                                lists = (item[1],)
+                            elif label == "uns" or label == "snote":
+                                notes = item[1] if label == "uns" else (item[1],)
+                                lists = [
+                                    note_item[1]
+                                    for note in notes
+                                    for note_item in note
+                                    if len(note_item) >= 2 and note_item[0] == "vis"
+                                ]
+                            else:
+                                continue
+                            for vis in lists:
+                                for ex in vis:
+                                    text = render_text(ex.get("t", "")).strip()
+                                    if text:
+                                        examples[text] = None
+                        sense = sense.get("sdsense")
+    return list(examples)
 
 
 def fetch_dictionary_entry(
     word: str,
     api_key: str,
     session: requests.Session,
+    fields: Collection[str] = DEFAULT_ENTRY_FIELDS,
 ) -> DictionaryEntry | None:
     """
-    Fetches definition and example sentences for a single word from the
-    Merriam-Webster Dictionary API.
+    Fetches definition and example sentences (or any other ENTRY_FIELDS)
+    for a single word from the Merriam-Webster Dictionary API, from its
+    first entry. See fetch_dictionary_entries for the other homographs.
 
     The API key is passed as a query parameter (not interpolated into the URL)
     to avoid key exposure in logs or proxies.
@@ -71,79 +121,642 @@ def fetch_dictionary_entry(
         word: The word to look up.
         api_key: MW Dictionary API key.
         session: Shared requests.Session for connection reuse.
+        fields: Entry fields to extract; others are not parsed.
 
     Returns:
         A DictionaryEntry, or None if the word is not found or the request fails.
     """
+    entries = fetch_dictionary_entries(word, api_key, session, fields)
+    return entries[0] if entries else None
+
+
+def fetch_dictionary_entries(
+    word: str,
+    api_key: str,
+    session: requests.Session,
+    fields: Collection[str] = DEFAULT_ENTRY_FIELDS,
+    homographs: str = DEFAULT_HOMOGRAPH_MODE,
+) -> list[DictionaryEntry]:
+    """
+    Like fetch_dictionary_entry, but can return every homograph of the
+    word — the entries whose meta.id is the first entry's headword, such as
+    "bear:1" (noun) and "bear:2" (verb) — from the same single response.
+
+    Args:
+        word: The word to look up.
+        api_key: MW Dictionary API key.
+        session: Shared requests.Session for connection reuse.
+        fields: Entry fields to extract; others are not parsed.
+        homographs: "first", "split" or "merge" (see HOMOGRAPH_MODES).
+
+    Returns:
+        The entries, empty if the word is not found or the request fails.
+    """
     try:
-        resp = session.get(f"{DICT_API_BASE_URL}/{word}", params={"key": api_key})
-        resp.raise_for_status()
-        entries = resp.json()
+        _rate_limiter.acquire()
+        entries = _request_entries(normalize_word(word), api_key, session)
     except requests.HTTPError as exc:
-        logger.error("HTTP error fetching '%s': %s", word, exc)
-        return None
+        status = exc.response.status_code if exc.response is not None else None
+        logger.error("HTTP error fetching '%s': %s", word, describe_error(exc, status))
+        return []
     except ValueError:
         logger.error("Invalid JSON response for '%s'.", word)
-        return None
+        return []
+
+    return _parse_response(word, entries, fields, homographs)
+
+
+def _request_entries(word: str, api_key: str, session: requests.Session) -> object:
+    """
+    Performs the API request and returns the decoded JSON body. Callers take
+    a token from the shared rate limiter first.
+
+    Raises:
+        requests.HTTPError: On non-2xx responses.
+        ValueError: If the body is not valid JSON.
+    """
+    resp = session.get(
+        f"{DICT_API_BASE_URL}/{url_segment(word)}",
+        params={"key": api_key},
+        timeout=(DICT_CONNECT_TIMEOUT_SECS, DICT_READ_TIMEOUT_SECS),
+    )
+    resp.raise_for_status()
+    return resp.json()
+
 
+class _EntryView:
+    """
+    Lazily parsed view of one API entry. Each field is extracted on first
+    access and kept, so a lookup walks only the parts of the response its
+    requested fields need: "description" reads shortdef alone, while
+    "examples" walks the whole definition section once.
+    """
+
+    def __init__(self, raw: dict) -> None:
+        self._raw = raw
+
+    @cached_property
+    def description(self) -> str:
+        shortdef = self._raw.get("shortdef", [])
+        return shortdef[0] if shortdef else ""
+
+    @cached_property
+    def examples(self) -> list[str]:
+        return _parse_examples(self._raw)
+
+    @cached_property
+    def pronunciations(self) -> list[str]:
+        prs = self._raw.get("hwi", {}).get("prs", [])
+        return [pr["mw"] for pr in prs if "mw" in pr]
+
+    @cached_property
+    def functional_label(self) -> str:
+        return self._raw.get("fl", "")
+
+    @cached_property
+    def etymology(self) -> str:
+        texts = (render(item[1]).strip() for item in self._raw.get("et", []) if item[0] == "text")
+        return " ".join(text for text in texts if text)
+
+    @cached_property
+    def stems(self) -> list[str]:
+        return list(self._raw.get("meta", {}).get("stems", []))
+
+    @cached_property
+    def offensive(self) -> bool:
+        return bool(self._raw.get("meta", {}).get("offensive", False))
+
+
+def _entry_id(raw: object) -> str:
+    if not isinstance(raw, dict):
+        return ""
+    return raw.get("meta", {}).get("id", "")
+
+
+def _homograph_number(entry_id: str) -> int | None:
+    _, colon, number = entry_id.rpartition(":")
+    return int(number) if colon and number.isdigit() else None
+
+
+def _merge_field(values: list) -> object:
+    """Combines one field across homographs: lists are unioned in order,
+    strings joined with "; " and flags OR-ed."""
+    if isinstance(values[0], bool):
+        return any(values)
+    if isinstance(values[0], list):
+        return list(dict.fromkeys(item for value in values for item in value))
+    return "; ".join(dict.fromkeys(value for value in values if value))
+
+
+def _parse_response(
+    word: str,
+    entries: object,
+    fields: Collection[str] = DEFAULT_ENTRY_FIELDS,
+    homographs: str = DEFAULT_HOMOGRAPH_MODE,
+) -> list[DictionaryEntry]:
+    """
+    Builds DictionaryEntry objects with the requested fields (see
+    ENTRY_FIELDS) from a decoded API response; empty if not found. Fields
+    that were not requested are left at their defaults and never parsed.
+
+    The response lists the word's homographs (entries whose meta.id, less
+    its ":N" suffix, is the first entry's headword) ahead of related
+    entries such as phrases. "first" returns one entry built from the first
+    of them, "split" one per homograph (numbered from meta.id), and "merge"
+    one entry combining all of them.
+    """
     if not entries or not isinstance(entries, list):
         logger.warning("No data returned for '%s'.", word)
-        return None
+        return []
 
     first = entries[0]
     if not isinstance(first, dict) or "meta" not in first:
         # API returns a list of string suggestions when the word is not found.
         logger.warning("'%s' not found; API returned suggestions.", word)
-        return None
+        return []
 
-    shortdef = first.get("shortdef", [])
-    return DictionaryEntry(
-        word=word,
-        description=shortdef[0] if shortdef else "",
-        examples=_parse_examples(first),
+    if homographs == "first":
+        raws = [first]
+    else:
+        headword = entry_headword(first)
+        raws = [raw for raw in entries if entry_headword(raw) == headword]
+    views = [_EntryView(raw) for raw in raws]
+
+    if homographs == "merge":
+        entry = DictionaryEntry(word=word)
+        for name in fields:
+            setattr(entry, name, _merge_field([getattr(view, name) for view in views]))
+        return [entry]
+
+    parsed = []
+    for raw, view in zip(raws, views):
+        entry = DictionaryEntry(word=word)
+        if homographs == "split":
+            entry.homograph = _homograph_number(_entry_id(raw))
+        for name in fields:
+            setattr(entry, name, getattr(view, name))
+        parsed.append(entry)
+    return parsed
+
+
+def new_concurrency_limiter() -> AdaptiveLimiter:
+    """Returns an AdaptiveLimiter configured from the DICT_CONCURRENCY_* constants."""
+    return AdaptiveLimiter(
+        initial=DICT_CONCURRENCY_INITIAL,
+        minimum=DICT_CONCURRENCY_MIN,
+        maximum=DICT_MAX_WORKERS,
     )
 
 
-def _fetch_worker(args: tuple[int, str, str]) -> tuple[int, DictionaryEntry | None]:
-    index, word, api_key = args
-    session = _get_session()
-    entry = fetch_dictionary_entry(word, api_key, session)
-    time.sleep(DICT_DELAY_SECS)
-    return index, entry
+def _lookup(
+    word: str,
+    api_key: str,
+    session: requests.Session,
+    cache: DictionaryCache | None,
+    limiter: AdaptiveLimiter,
+    deadline: Deadline | None = None,
+    fields: Collection[str] = DEFAULT_ENTRY_FIELDS,
+    homographs: str = DEFAULT_HOMOGRAPH_MODE,
+) -> list[DictionaryEntry]:
+    """
+    Looks up one word, retrying transient failures (connection errors,
+    timeouts, truncated bodies and any other requests error, 429, 5xx) up
+    to DICT_MAX_RETRIES times with jittered
+    exponential backoff that honours Retry-After. The concurrency slot is
+    released while backing off.
+
+    The cache is always consulted; the network is not once the deadline is
+    near, checked again after waiting for a concurrency slot and a rate
+    token, and a backoff that would run past it ends the retries. Cached and
+    fetched responses alike are parsed for the requested fields only.
+
+    Returns:
+        The entries (see _parse_response), empty if the word is not found or
+        fails permanently.
+
+    Raises:
+        TransientLookupError: If the last attempt still failed transiently.
+        DeadlineExceeded: If the lookup was skipped because of the deadline.
+    """
+    if cache is not None:
+        hit, response = cache.get(word)
+        if hit:
+            return _parse_response(word, response, fields, homographs)
+
+    error = ""
+    for attempt in range(DICT_MAX_RETRIES + 1):
+        if deadline is not None and deadline.near():
+            raise DeadlineExceeded(f"'{word}' skipped: run deadline reached.")
+        limiter.acquire()
+        # Take the rate token before starting the clock: the limiter must see
+        # the API's latency, not time spent queued on our own rate limit.
+        _rate_limiter.acquire()
+        # Either wait can outlast the margin; a request sent now could end
+        # past the deadline.
+        if deadline is not None and deadline.near():
+            limiter.abandon()
+            raise DeadlineExceeded(f"'{word}' skipped: run deadline reached.")
+        started = time.monotonic()
+        status: int | None = None
+        retry_after: str | None = None
+        try:
+            entries = _request_entries(word, api_key, session)
+        except requests.HTTPError as exc:
+            if exc.response is not None:
+                status = exc.response.status_code
+                retry_after = exc.response.headers.get("Retry-After")
+            if not is_transient_status(status):
+                logger.error("HTTP error fetching '%s': %s", word, describe_error(exc, status))
+                return []
+            error = describe_error(exc, status)
+        except ValueError:
+            # Before RequestException: requests' JSONDecodeError is both.
+            logger.error("Invalid JSON response for '%s'.", word)
+            return []
+        except requests.RequestException as exc:
+            error = describe_error(exc)
+        else:
+            if cache is not None:
+                cache.put(word, entries)
+            return _parse_response(word, entries, fields, homographs)
+        finally:
+            limiter.release(time.monotonic() - started, overloaded=is_transient_status(status))
+
+        if attempt < DICT_MAX_RETRIES:
+            delay = backoff_delay(attempt, retry_after)
+            if deadline is not None and delay > deadline.remaining():
+                raise DeadlineExceeded(f"'{word}' skipped: retry would pass run deadline.")
+            logger.warning(
+                "Transient error fetching '%s' (%s); retry %d / %d in %.1f s.",
+                word, error, attempt + 1, DICT_MAX_RETRIES, delay,
+            )
+            time.sleep(delay)
+
+    raise TransientLookupError(f"'{word}' failed after {DICT_MAX_RETRIES} retries: {error}")
+
+
+def _fetch_worker(
+    args: tuple[str, str, DictionaryCache | None, AdaptiveLimiter, Deadline | None, Collection[str], str],
+) -> tuple[list[DictionaryEntry], str]:
+    """
+    Returns (entries, outcome) for one lookup key. outcome is "" on success,
+    "deferred" if retries ran out and "skipped" if the deadline stopped it.
+    """
+    key, api_key, cache, limiter, deadline, fields, homographs = args
+    try:
+        session = _get_session()
+        return _lookup(key, api_key, session, cache, limiter, deadline, fields, homographs), ""
+    except TransientLookupError as exc:
+        logger.warning("Deferring %s", exc)
+        return [], "deferred"
+    except DeadlineExceeded as exc:
+        logger.info("%s", exc)
+        return [], "skipped"
+
+
+class _ReorderBuffer:
+    """
+    Bookkeeping between the input word list and the lookups, shared by both
+    enrichment engines.
+
+    Every input word becomes a numbered position. Positions whose normalized
+    key already has a lookup outstanding are coalesced onto it rather than
+    starting another. When a lookup resolves, the positions it answers become
+    ready: unordered, they are released at once; ordered, only the longest
+    complete prefix of positions is released and the rest wait here. A key's
+    result is dropped once its last position is released, so a duplicate that
+    arrives after that starts a fresh lookup (usually a cache hit).
+
+    Engines bound the buffer by holding one ENRICH_QUEUE_SIZE slot per
+    position from the moment the word is read until it is released.
+
+    A word may come with a headword key (DictionaryCache.lookup_key, which
+    engines call off their consuming thread or event loop); it replaces the
+    word's own key, so inflections whose headword is in the cache's stem
+    index ("ran", "runs" -> "run") coalesce onto one lookup of the
+    headword's cached response.
+    """
+
+    def __init__(self, ordered: bool) -> None:
+        self._ordered = ordered
+        self._positions: dict[int, tuple[str, str]] = {}
+        self._waiters: dict[str, list[int]] = {}
+        self._results: dict[str, list[DictionaryEntry]] = {}
+        self._next_position = 0
+        self._next_release = 0
+        self.words = 0
+        self.lookups = 0
+        self.inflections = 0
+
+    def add(self, word: str, headword_key: str = "") -> tuple[str, bool]:
+        """
+        Registers the next input word, under headword_key if one is given.
+        Returns (key, start): start is True if the caller must look key up. A
+        blank word returns ("", False), holds no position and must have its
+        slot returned by the caller.
+        """
+        key = normalize_word(word)
+        if not key:
+            logger.warning("Skipping blank word %r.", word)
+            return "", False
+        if headword_key and headword_key != key:
+            logger.debug("'%s' is a stem of cached '%s'.", key, headword_key)
+            self.inflections += 1
+            key = headword_key
+        position = self._next_position
+        self._next_position += 1
+        self._positions[position] = (word, key)
+        self.words += 1
+        if key in self._waiters:
+            self._waiters[key].append(position)
+            return key, False
+        self._waiters[key] = [position]
+        self.lookups += 1
+        return key, True
+
+    def waiting(self, key: str) -> int:
+        """Number of positions waiting on key's lookup."""
+        return len(self._waiters[key])
+
+    def resolve(self, key: str, entries: list[DictionaryEntry]) -> list[list[DictionaryEntry]]:
+        """
+        Records the entries for key and returns the results now released, one
+        list per position (empty where the word was not found), each entry
+        under its position's original spelling.
+        """
+        self._results[key] = entries
+        if not self._ordered:
+            return [self._release(position) for position in list(self._waiters[key])]
+        released = []
+        while self._next_release < self._next_position:
+            _, pending_key = self._positions[self._next_release]
+            if pending_key not in self._results:
+                break
+            released.append(self._release(self._next_release))
+            self._next_release += 1
+        return released
+
+    def _release(self, position: int) -> list[DictionaryEntry]:
+        word, key = self._positions.pop(position)
+        waiting = self._waiters[key]
+        waiting.remove(position)
+        entries = self._results[key]
+        if not waiting:
+            del self._waiters[key]
+            del self._results[key]
+        return [replace(entry, word=word) for entry in entries]
+
+
+def iter_enriched(
+    words: Iterable[str],
+    api_key: str,
+    cache: DictionaryCache | None = None,
+    limiter: AdaptiveLimiter | None = None,
+    deadline: Deadline | None = None,
+    ordered: bool = True,
+    fields: Collection[str] = DEFAULT_ENTRY_FIELDS,
+    homographs: str = DEFAULT_HOMOGRAPH_MODE,
+    retry_deferred_last: bool | None = None,
+    failed: list[str] | None = None,
+) -> Iterator[DictionaryEntry]:
+    """
+    Fetches dictionary data for each word concurrently using a thread pool and
+    yields entries as they become available.
+    All workers share one token bucket, so requests go out at no more than
+    DICT_RATE_PER_SEC however many threads are running.
+
+    The pool has DICT_MAX_WORKERS threads, but the number of requests actually
+    in flight is set by an AIMD controller (see AdaptiveLimiter): it ramps up
+    while latency stays flat and backs off on 429/5xx or rising p95 latency.
+
+    Transient failures are retried with backoff (see _lookup). Words that
+    exhaust their retries are deferred to a second pool of
+    DICT_DEFERRED_CONCURRENCY workers with its own, fixed concurrency limit.
+    By default an ordered stream retries them at once, alongside the main
+    pass, so they don't hold up the words behind them until it ends; an
+    unordered stream has no such head-of-line cost and retries them after
+    the main pass, once the server has had time to recover.
+
+    With a deadline, once it is near (see Deadline) words are still read
+    and answered from the cache, but lookups that would need a request are
+    skipped; no further input is read once the deadline itself has passed.
+    The deadline object records the words skipped and whether the result is
+    incomplete.
+
+    words may be a lazy iterable (e.g. a streaming wordlist fetch). It is
+    consumed on a reader thread, and each word is submitted to the pool as
+    soon as it arrives, so lookups overlap with pagination. At most
+    ENRICH_QUEUE_SIZE words are read but not yet yielded — in flight or
+    waiting in the reorder buffer; beyond that the reader blocks
+    (backpressure).
+
+    Words are normalized (see normalize_word) into lookup keys and duplicate
+    keys are coalesced: only one lookup runs per key, and its result is fanned
+    out to every list position that asked for it, under that position's
+    original spelling. With a cache that redirects stems, inflections of an
+    already cached headword (see DictionaryCache.lookup_key) share its key,
+    so they are grouped before any lookup is scheduled and answered from
+    the cache.
+
+    Ordered, entries come out in input order, each as soon as every word
+    before it has resolved. Unordered, each comes out as soon as its lookup
+    finishes.
+
+    When a cache is given it is consulted before any network call; cache hits
+    cost no request and no rate-limit token. Successful lookups and
+    "not found" answers are written back; transient failures are not.
 
+    Closing the generator early stops reading words and cancels queued
+    lookups; requests already in flight are allowed to finish.
 
-def enrich_words(words: list[str], api_key: str) -> list[DictionaryEntry]:
+    Args:
+        words: Words to enrich, in output order.
+        api_key: MW Dictionary API key.
+        cache: Optional persistent response cache.
+        limiter: Concurrency controller; pass one in to read its limit
+            afterwards. Defaults to new_concurrency_limiter().
+        deadline: Optional whole-run deadline.
+        ordered: Yield in input order (default) or in completion order.
+        fields: Entry fields to extract (see ENTRY_FIELDS).
+        homographs: "first", "split" or "merge" (see HOMOGRAPH_MODES); with
+            "split" a word yields one entry per homograph, consecutively.
+        retry_deferred_last: Retry deferred words after the main pass rather
+            than alongside it. Defaults to True when unordered.
+        failed: Receives the keys of words that still failed after their
+            deferred retry; pass a list in to find out whether the result is
+            complete.
+
+    Yields:
+        DictionaryEntry objects for successfully resolved words.
     """
-    Fetches dictionary data for each word concurrently using a thread pool,
-    with per-thread courtesy delays between requests.
+    if limiter is None:
+        limiter = new_concurrency_limiter()
+    if retry_deferred_last is None:
+        retry_deferred_last = not ordered
+    if failed is None:
+        failed = []
+    deferred_limiter = AdaptiveLimiter(
+        initial=DICT_DEFERRED_CONCURRENCY,
+        minimum=1,
+        maximum=DICT_DEFERRED_CONCURRENCY,
+    )
+    buffer = _ReorderBuffer(ordered)
+    slots = threading.BoundedSemaphore(ENRICH_QUEUE_SIZE)
+    events: queue.Queue[tuple[str, str, object]] = queue.Queue()
+    stop = threading.Event()
 
-    Each thread maintains its own requests.Session for connection reuse.
-    Original word order is preserved in the returned list.
+    def read() -> None:
+        try:
+            for word in words:
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                headword_key = cache.lookup_key(word) if cache is not None else ""
+                events.put(("word", headword_key, word))
+            events.put(("end", "", None))
+        except Exception as exc:
+            events.put(("error", "", exc))
+        finally:
+            close = getattr(words, "close", None)
+            if close is not None:
+                close()
+
+    reader = threading.Thread(target=read, name="enrich-reader", daemon=True)
+    executor = ThreadPoolExecutor(max_workers=DICT_MAX_WORKERS)
+    deferred_executor = ThreadPoolExecutor(max_workers=DICT_DEFERRED_CONCURRENCY)
+
+    def submit(pool: ThreadPoolExecutor, kind: str, key: str, lookup_limiter: AdaptiveLimiter) -> None:
+        future = pool.submit(
+            _fetch_worker, (key, api_key, cache, lookup_limiter, deadline, fields, homographs)
+        )
+        future.add_done_callback(lambda f: events.put((kind, key, f)))
+
+    reading = True
+    in_flight = completed = emitted = 0
+    # Deferred keys held back until the main pass ends (retry_deferred_last).
+    held: list[str] = []
+    reader.start()
+    try:
+        while reading or in_flight or held:
+            if held and not reading and not in_flight:
+                logger.info("Main pass done; retrying %d deferred word(s).", len(held))
+                for held_key in held:
+                    submit(deferred_executor, "retried", held_key, deferred_limiter)
+                in_flight += len(held)
+                held.clear()
+            kind, key, payload = events.get()
+            if kind == "error":
+                raise payload  # type: ignore[misc]
+            if kind == "end":
+                reading = False
+                continue
+            if kind == "word":
+                if not reading:
+                    continue
+                if deadline is not None and deadline.expired():
+                    logger.warning("Run deadline passed; not reading further words.")
+                    deadline.mark_incomplete()
+                    reading = False
+                    stop.set()
+                    continue
+                key, start = buffer.add(payload, key)  # type: ignore[arg-type]
+                if not key:
+                    slots.release()
+                elif start:
+                    submit(executor, "done", key, limiter)
+                    in_flight += 1
+                continue
+
+            in_flight -= 1
+            result, outcome = payload.result()  # type: ignore[attr-defined]
+            if kind == "done":
+                completed += 1
+                logger.info("Processed word %d: %s", completed, key)
+            if outcome == "deferred" and kind == "done":
+                if retry_deferred_last:
+                    held.append(key)
+                    continue
+                if deadline is None or not deadline.near():
+                    submit(deferred_executor, "retried", key, deferred_limiter)
+                    in_flight += 1
+                    continue
+                logger.warning("Run deadline reached; skipping deferred word '%s'.", key)
+                outcome = "skipped"
+            elif outcome == "deferred":
+                failed.append(key)
+            if outcome == "skipped":
+                deadline.skip(buffer.waiting(key))  # type: ignore[union-attr]
+            for entries in buffer.resolve(key, result):
+                slots.release()
+                if entries:
+                    emitted += 1
+                    yield from entries
+    finally:
+        stop.set()
+        executor.shutdown(cancel_futures=True)
+        deferred_executor.shutdown(cancel_futures=True)
+        reader.join()
+
+    if failed:
+        logger.error(
+            "%d word(s) could not be fetched and are missing from the export: %s",
+            len(failed), ", ".join(failed),
+        )
+    logger.info(
+        "Enriched %d / %d words with %d lookups (%d duplicates coalesced, "
+        "%d inflections via the stem index).",
+        emitted, buffer.words, buffer.lookups, buffer.words - buffer.lookups,
+        buffer.inflections,
+    )
+    logger.info(
+        "Concurrency limit: final %d, peak %d, %d decrease(s).",
+        limiter.limit, limiter.peak_limit, limiter.decreases,
+    )
+
+
+def enrich_words(
+    words: Iterable[str],
+    api_key: str,
+    cache: DictionaryCache | None = None,
+    limiter: AdaptiveLimiter | None = None,
+    deadline: Deadline | None = None,
+    fields: Collection[str] = DEFAULT_ENTRY_FIELDS,
+    homographs: str = DEFAULT_HOMOGRAPH_MODE,
+    failed: list[str] | None = None,
+) -> list[DictionaryEntry]:
+    """
+    Collects iter_enriched into a list; see there for scheduling, retries,
+    caching and deadline behaviour. As nothing is returned before the whole
+    list is done, deferred words are retried after the main pass.
 
     Args:
-        words: List of words to enrich.
+        words: Words to enrich, in output order.
         api_key: MW Dictionary API key.
+        cache: Optional persistent response cache.
+        limiter: Concurrency controller; pass one in to read its limit
+            afterwards. Defaults to new_concurrency_limiter().
+        deadline: Optional whole-run deadline.
+        fields: Entry fields to extract (see ENTRY_FIELDS).
+        homographs: "first", "split" or "merge" (see HOMOGRAPH_MODES).
+        failed: Receives the keys of words that could not be fetched (see
+            iter_enriched).
 
     Returns:
         List of DictionaryEntry objects for successfully resolved words,
         in the same order as the input.
     """
-    results_map: dict[int, DictionaryEntry] = {}
-    total = len(words)
-    completed = 0
-
-    with ThreadPoolExecutor(max_workers=DICT_MAX_WORKERS) as executor:
-        futures = {
-            executor.submit(_fetch_worker, (i, word, api_key)): word
-            for i, word in enumerate(words)
-        }
-        for future in as_completed(futures):
-            completed += 1
-            index, entry = future.result()
-            if entry:
-                results_map[index] = entry
-            logger.info("Processed word %d / %d: %s", completed, total, futures[future])
-
-    results = [results_map[i] for i in sorted(results_map)]
-    logger.info("Enriched %d / %d words.", len(results), total)
-    return results
+    return list(
+        iter_enriched(
+            words,
+            api_key,
+            cache,
+            limiter,
+            deadline,
+            fields=fields,
+            homographs=homographs,
+            retry_deferred_last=True,
+            failed=failed,
+        )
+    )
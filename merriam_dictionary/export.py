@@ -0,0 +1,389 @@
+import gzip
+import hashlib
+import io
+import json
+import logging
+import os
+import sqlite3
+import time
+from types import TracebackType
+from typing import TextIO
+
+from .config import DEFAULT_OUTPUT_STEM
+from .models import DictionaryEntry
+from .storage import remove_file
+
+logger = logging.getLogger(__name__)
+
+_EXTENSIONS: dict[str, str] = {
+    "json": ".json",
+    "compact": ".json",
+    "ndjson": ".ndjson",
+    "sqlite": ".sqlite3",
+}
+_COMPRESSION_SUFFIXES: dict[str, str] = {"none": "", "gzip": ".gz", "zstd": ".zst"}
+_COMPACT = (",", ":")
+
+# Entry fields the SQLite export has tables for.
+SQLITE_FIELDS: tuple[str, ...] = ("description", "examples")
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS words (
+    id         INTEGER PRIMARY KEY,
+    word       TEXT NOT NULL,
+    homograph  INTEGER NOT NULL DEFAULT 0,
+    digest     TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    UNIQUE (word, homograph)
+);
+CREATE TABLE IF NOT EXISTS definitions (
+    word_id    INTEGER NOT NULL REFERENCES words (id) ON DELETE CASCADE,
+    position   INTEGER NOT NULL,
+    text       TEXT NOT NULL,
+    PRIMARY KEY (word_id, position)
+);
+CREATE TABLE IF NOT EXISTS examples (
+    word_id    INTEGER NOT NULL REFERENCES words (id) ON DELETE CASCADE,
+    position   INTEGER NOT NULL,
+    text       TEXT NOT NULL,
+    PRIMARY KEY (word_id, position)
+);
+CREATE TABLE IF NOT EXISTS export_meta (
+    key        TEXT PRIMARY KEY,
+    value      TEXT NOT NULL
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5 (word, definitions, examples);
+"""
+
+# Rows not written by the current run (removed from the saved-words list).
+_STALE_WORDS = "SELECT id FROM words WHERE id NOT IN (SELECT id FROM temp.written)"
+
+
+def default_output_file(fmt: str, compression: str) -> str:
+    """Default export file name for a format and compression, e.g. dictionary_output.ndjson.gz."""
+    return DEFAULT_OUTPUT_STEM + _EXTENSIONS[fmt] + _COMPRESSION_SUFFIXES[compression]
+
+
+def _open_text(path: str, mode: str, compression: str) -> TextIO:
+    """
+    Opens path for text reading ("r") or writing ("w") through the given
+    compression.
+
+    Raises:
+        RuntimeError: If zstd is requested and zstandard is not installed.
+    """
+    if compression == "gzip":
+        return gzip.open(path, mode + "t", encoding="utf-8")  # type: ignore[return-value]
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as exc:
+            raise RuntimeError(
+                "zstd compression requires zstandard: pip install zstandard"
+            ) from exc
+        raw = open(path, mode + "b")
+        if mode == "w":
+            stream = zstandard.ZstdCompressor().stream_writer(raw)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        return io.TextIOWrapper(stream, encoding="utf-8")  # type: ignore[arg-type]
+    return open(path, mode, encoding="utf-8")
+
+
+class ExportWriter:
+    """
+    Writes the export incrementally, one entry at a time, as enrichment
+    produces them. Formats:
+
+        json     {"data": [...], "total_words": N}, indented
+        compact  the same document without whitespace
+        ndjson   one DictionaryEntry object per line, no envelope
+
+    In the JSON formats total_words (and "incomplete", when set) follow the
+    data array, since they are only known once the last entry is in. NDJSON
+    has no trailer, so lines can be split and loaded in parallel. The output
+    can be gzip- or zstd-compressed as it is written. Each entry is
+    serialized once; with a mirror stream (e.g. stdout for --print-json) the
+    same uncompressed text is written there as well.
+
+    The export is written to a temp file alongside the target and renamed
+    into place by finish(), so an interrupted run leaves any previous export
+    untouched. Used as a context manager, the temp file is removed if the
+    block exits without finish() having been called.
+
+    Raises:
+        RuntimeError: If zstd is requested and zstandard is not installed.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fmt: str = "json",
+        compression: str = "none",
+        mirror: TextIO | None = None,
+    ) -> None:
+        self._path = path
+        self._tmp_path = f"{path}.tmp"
+        self._format = fmt
+        self._file = _open_text(self._tmp_path, "w", compression)
+        self._streams: list[TextIO] = [self._file] if mirror is None else [self._file, mirror]
+        self._finished = False
+        self.count = 0
+        if fmt == "json":
+            self._emit('{\n  "data": [')
+        elif fmt == "compact":
+            self._emit('{"data":[')
+
+    def __enter__(self) -> "ExportWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if not self._finished:
+            self.discard()
+
+    def _emit(self, text: str) -> None:
+        for stream in self._streams:
+            stream.write(text)
+
+    def write(self, entry: DictionaryEntry) -> None:
+        """Appends one entry to the export."""
+        if self._format == "json":
+            body = json.dumps(entry.to_dict(), indent=2).replace("\n", "\n    ")
+            self._emit(("," if self.count else "") + "\n    " + body)
+        elif self._format == "compact":
+            self._emit(("," if self.count else "") + json.dumps(entry.to_dict(), separators=_COMPACT))
+        else:
+            self._emit(json.dumps(entry.to_dict(), separators=_COMPACT) + "\n")
+        self.count += 1
+
+    def finish(self, incomplete: bool = False) -> None:
+        """
+        Closes the export and atomically replaces the target file. The JSON
+        formats end with total_words and, for a partial export,
+        "incomplete": true; NDJSON cannot record either.
+        """
+        trailer: dict[str, object] = {"total_words": self.count}
+        if incomplete:
+            trailer["incomplete"] = True
+        if self._format == "json":
+            fields = "".join(f",\n  {json.dumps(key)}: {json.dumps(value)}" for key, value in trailer.items())
+            self._emit(("\n  ]" if self.count else "]") + fields + "\n}\n")
+        elif self._format == "compact":
+            fields = "".join(f",{json.dumps(key)}:{json.dumps(value)}" for key, value in trailer.items())
+            self._emit("]" + fields + "}\n")
+        for stream in self._streams[1:]:
+            stream.flush()
+        self._file.close()
+        os.replace(self._tmp_path, self._path)
+        self._finished = True
+
+    def discard(self) -> None:
+        """Abandons the export, removing the temp file."""
+        self._file.close()
+        remove_file(self._tmp_path)
+        self._finished = True
+
+
+class SqliteExportWriter:
+    """
+    Export sink that upserts entries into a SQLite database:
+
+        words        one row per word (per homograph with --homographs split;
+                     homograph is 0 otherwise), with a digest of its
+                     exported content
+        definitions  (word_id, position, text)
+        examples     (word_id, position, text)
+        entries_fts  FTS5 index over word, definitions and examples; rowid is
+                     words.id, e.g. SELECT word FROM entries_fts WHERE
+                     examples MATCH 'garden'
+        export_meta  total_words and incomplete for the last run
+
+    Only SQLITE_FIELDS are stored; a field that was not requested is stored
+    as empty.
+
+    Entries whose digest is unchanged since the previous run are not
+    rewritten. The whole run is one transaction, committed by finish(); a
+    complete run also deletes words it did not write, so the database tracks
+    the saved-words list. With a mirror stream, each entry is also written
+    there as one NDJSON line.
+
+    Raises:
+        RuntimeError: If the database cannot be opened or SQLite lacks FTS5.
+    """
+
+    def __init__(self, path: str, mirror: TextIO | None = None) -> None:
+        try:
+            self._conn = sqlite3.connect(path, isolation_level=None)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            self._conn.executescript(_SQLITE_SCHEMA)
+            self._conn.execute("CREATE TEMP TABLE written (id INTEGER PRIMARY KEY)")
+            self._conn.execute("BEGIN")
+        except sqlite3.Error as exc:
+            raise RuntimeError(f"Cannot open SQLite export {path}: {exc}") from exc
+        self._mirror = mirror
+        self._finished = False
+        self.count = 0
+        self.changed = 0
+
+    def __enter__(self) -> "SqliteExportWriter":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if not self._finished:
+            self.discard()
+
+    def write(self, entry: DictionaryEntry) -> None:
+        """Upserts one entry, skipping the write if its content is unchanged."""
+        if self._mirror is not None:
+            self._mirror.write(json.dumps(entry.to_dict(), separators=_COMPACT) + "\n")
+        # Only the columns stored here count as a change.
+        examples = entry.examples or []
+        stored = json.dumps([entry.word, entry.description or "", examples], separators=_COMPACT)
+        digest = hashlib.sha1(stored.encode()).hexdigest()
+        conn = self._conn
+        homograph = entry.homograph or 0
+        row = conn.execute(
+            "SELECT id, digest FROM words WHERE word = ? AND homograph = ?",
+            (entry.word, homograph),
+        ).fetchone()
+        if row is not None and row[1] == digest:
+            word_id = row[0]
+        else:
+            if row is None:
+                word_id = conn.execute(
+                    "INSERT INTO words (word, homograph, digest, updated_at) VALUES (?, ?, ?, ?)",
+                    (entry.word, homograph, digest, time.time()),
+                ).lastrowid
+            else:
+                word_id = row[0]
+                conn.execute(
+                    "UPDATE words SET digest = ?, updated_at = ? WHERE id = ?",
+                    (digest, time.time(), word_id),
+                )
+                conn.execute("DELETE FROM definitions WHERE word_id = ?", (word_id,))
+                conn.execute("DELETE FROM examples WHERE word_id = ?", (word_id,))
+                conn.execute("DELETE FROM entries_fts WHERE rowid = ?", (word_id,))
+            definitions = [entry.description] if entry.description else []
+            conn.executemany(
+                "INSERT INTO definitions (word_id, position, text) VALUES (?, ?, ?)",
+                [(word_id, i, text) for i, text in enumerate(definitions)],
+            )
+            conn.executemany(
+                "INSERT INTO examples (word_id, position, text) VALUES (?, ?, ?)",
+                [(word_id, i, text) for i, text in enumerate(examples)],
+            )
+            conn.execute(
+                "INSERT INTO entries_fts (rowid, word, definitions, examples) VALUES (?, ?, ?, ?)",
+                (word_id, entry.word, "\n".join(definitions), "\n".join(examples)),
+            )
+            self.changed += 1
+        conn.execute("INSERT OR IGNORE INTO temp.written (id) VALUES (?)", (word_id,))
+        self.count += 1
+
+    def finish(self, incomplete: bool = False) -> None:
+        """
+        Records total_words and incomplete, removes words the run did not
+        write (complete runs only) and commits.
+        """
+        conn = self._conn
+        removed = 0
+        if not incomplete:
+            conn.execute(f"DELETE FROM entries_fts WHERE rowid IN ({_STALE_WORDS})")
+            removed = conn.execute(f"DELETE FROM words WHERE id IN ({_STALE_WORDS})").rowcount
+        conn.executemany(
+            "INSERT OR REPLACE INTO export_meta (key, value) VALUES (?, ?)",
+            [("total_words", str(self.count)), ("incomplete", "1" if incomplete else "0")],
+        )
+        conn.execute("COMMIT")
+        conn.close()
+        if self._mirror is not None:
+            self._mirror.flush()
+        self._finished = True
+        logger.info(
+            "SQLite export: %d new or changed, %d unchanged, %d removed.",
+            self.changed, self.count - self.changed, removed,
+        )
+
+    def discard(self) -> None:
+        """Rolls back everything written by this run."""
+        self._conn.execute("ROLLBACK")
+        self._conn.close()
+        self._finished = True
+
+
+def open_export(
+    path: str,
+    fmt: str = "json",
+    compression: str = "none",
+    mirror: TextIO | None = None,
+) -> ExportWriter | SqliteExportWriter:
+    """Returns the export sink for fmt (see ExportWriter and SqliteExportWriter)."""
+    if fmt == "sqlite":
+        return SqliteExportWriter(path, mirror)
+    return ExportWriter(path, fmt, compression, mirror)
+
+
+def _read_sqlite_export(path: str) -> tuple[list[DictionaryEntry], bool]:
+    if not os.path.exists(path):
+        return [], True
+    try:
+        conn = sqlite3.connect(path)
+    except sqlite3.Error as exc:
+        raise RuntimeError(f"Cannot open SQLite export {path}: {exc}") from exc
+    try:
+        entries: dict[int, DictionaryEntry] = {
+            word_id: DictionaryEntry(word=word, description="", examples=[], homograph=homograph or None)
+            for word_id, word, homograph in conn.execute(
+                "SELECT id, word, homograph FROM words ORDER BY id"
+            )
+        }
+        for word_id, text in conn.execute(
+            "SELECT word_id, text FROM definitions WHERE position = 0"
+        ):
+            entries[word_id].description = text
+        for word_id, text in conn.execute(
+            "SELECT word_id, text FROM examples ORDER BY word_id, position"
+        ):
+            entries[word_id].examples.append(text)
+        row = conn.execute("SELECT value FROM export_meta WHERE key = 'incomplete'").fetchone()
+    except sqlite3.Error as exc:
+        raise RuntimeError(f"Cannot read SQLite export {path}: {exc}") from exc
+    finally:
+        conn.close()
+    return list(entries.values()), row is None or row[0] != "1"
+
+
+def read_export(path: str, fmt: str = "json", compression: str = "none") -> tuple[list[DictionaryEntry], bool]:
+    """
+    Reads entries from a previous export. Returns (entries, complete); a
+    missing file reads as ([], True). NDJSON exports always read as complete.
+
+    Raises:
+        OSError: If the file cannot be read.
+        ValueError: If the file is not valid for the format.
+        RuntimeError: If zstd is requested and zstandard is not installed, or
+            a SQLite export cannot be read.
+    """
+    if fmt == "sqlite":
+        return _read_sqlite_export(path)
+    try:
+        f = _open_text(path, "r", compression)
+    except FileNotFoundError:
+        return [], True
+    with f:
+        if fmt == "ndjson":
+            return [DictionaryEntry.from_dict(json.loads(line)) for line in f if line.strip()], True
+        document = json.load(f)
+    entries = [DictionaryEntry.from_dict(item) for item in document.get("data", [])]
+    return entries, not document.get("incomplete", False)
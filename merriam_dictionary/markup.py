@@ -0,0 +1,171 @@
+import html
+import re
+from collections.abc import Iterator
+from typing import NamedTuple
+from urllib.parse import quote
+
+from .config import DICTIONARY_URL
+from .normalize import strip_homograph
+
+# Every {...} token in one scan; the body is split into name and |-fields.
+_TOKEN = re.compile(r"\{([^{}]*)\}")
+
+# Standalone tokens: (text, html, markdown).
+_MARKS: dict[str, tuple[str, str, str]] = {
+    "bc": (": ", "<b>:</b> ", "**:** "),
+    "ldquo": ("“", "“", "“"),
+    "rdquo": ("”", "”", "”"),
+    "p_br": ("\n", "<br>", "\n\n"),
+}
+
+# Paired tokens {x}...{/x}: (text open, text close, html open, html close,
+# markdown open, markdown close). Unknown pairs keep their content unstyled.
+_STYLES: dict[str, tuple[str, str, str, str, str, str]] = {
+    "b": ("", "", "<b>", "</b>", "**", "**"),
+    "it": ("", "", "<i>", "</i>", "*", "*"),
+    "wi": ("", "", "<i>", "</i>", "*", "*"),
+    "qword": ("", "", "<i>", "</i>", "*", "*"),
+    "phrase": ("", "", "<b><i>", "</i></b>", "***", "***"),
+    "parahw": ("", "", "<b>", "</b>", "**", "**"),
+    "inf": ("", "", "<sub>", "</sub>", "", ""),
+    "sup": ("", "", "<sup>", "</sup>", "", ""),
+    "sc": ("", "", '<span class="sc">', "</span>", "", ""),
+    "gloss": ("[", "]", "[", "]", "\\[", "\\]"),
+    "dx": ("— ", "", "— ", "", "— ", ""),
+    "dx_def": ("(", ")", "(", ")", "(", ")"),
+    "dx_ety": ("— ", "", "— ", "", "— ", ""),
+    "ma": ("— more at ", "", "— more at ", "", "— more at ", ""),
+}
+
+# Cross-reference tokens {name|text|id|...}, rendered as their text (a link
+# to the entry in HTML and Markdown). Other |-tokens, e.g. {ds|...}, are dropped.
+_LINKS = frozenset({"a_link", "d_link", "i_link", "et_link", "mat", "sx", "dxt"})
+
+_FORMAT_INDEX = {"text": 0, "html": 1, "markdown": 2}
+
+# Plain-text rendering of every fixed token body, for the fast path.
+_TEXT_TOKENS: dict[str, str] = {
+    **{name: style[0] for name, style in _STYLES.items()},
+    **{f"/{name}": style[1] for name, style in _STYLES.items()},
+    **{name: mark[0] for name, mark in _MARKS.items()},
+}
+_MARKDOWN_SPECIAL = re.compile(r"([\\`*_\[\]<>])")
+
+
+class Token(NamedTuple):
+    """One piece of MW markup: kind is "text", "open", "close", "mark" or "link"."""
+
+    kind: str
+    value: str
+    fields: tuple[str, ...] = ()
+
+
+def tokenize(text: str) -> Iterator[Token]:
+    """
+    Splits MW API markup into tokens in a single left-to-right scan.
+
+    {x} is an "open" token if x is a paired style, a "mark" otherwise; {/x}
+    is "close"; {x|a|b} is a "link" carrying its |-separated fields (also
+    for non-link tokens such as {ds|...}, which renderers drop). Unterminated
+    braces are plain text.
+    """
+    pos = 0
+    for match in _TOKEN.finditer(text):
+        start = match.start()
+        if start > pos:
+            yield Token("text", text[pos:start])
+        pos = match.end()
+        body = match.group(1)
+        if body.startswith("/"):
+            yield Token("close", body[1:])
+        elif "|" in body:
+            name, *fields = body.split("|")
+            yield Token("link", name, tuple(fields))
+        elif body in _STYLES:
+            yield Token("open", body)
+        else:
+            yield Token("mark", body)
+    if pos < len(text):
+        yield Token("text", text[pos:])
+
+
+def _text_link(body: str) -> str:
+    """Plain-text rendering of a token body not in _TEXT_TOKENS."""
+    name, _, rest = body.partition("|")
+    if name in _LINKS and rest:
+        return strip_homograph(rest.partition("|")[0])
+    return ""
+
+
+def render_text(text: str) -> str:
+    """
+    Renders MW API markup as plain text: render(text, "text") without the
+    format dispatch, for per-example loops.
+    """
+    # Most examples only italicise the headword ({it}/{wi}); dropping those
+    # pairs with C-level replaces skips the token scan entirely.
+    text = text.replace("{it}", "").replace("{/it}", "").replace("{wi}", "").replace("{/wi}", "")
+    if "{" not in text:
+        return text
+    pieces = _TOKEN.split(text)
+    for i in range(1, len(pieces), 2):
+        replacement = _TEXT_TOKENS.get(pieces[i])
+        pieces[i] = replacement if replacement is not None else _text_link(pieces[i])
+    return "".join(pieces)
+
+
+def render(text: str, fmt: str = "text") -> str:
+    """
+    Renders MW API markup as plain text, HTML or Markdown.
+
+    Styles map to their HTML/Markdown equivalents (and vanish in plain text),
+    {bc}, quotes and paragraph breaks become punctuation, and cross-reference
+    tokens such as {a_link|...}, {sx|...||} and {dxt|...} render as their
+    display text, linked to the entry outside plain text. Text is escaped for
+    HTML and Markdown.
+
+    Args:
+        text: A string from the API, e.g. a "vis" example or a "text" item.
+        fmt: "text", "html" or "markdown".
+
+    Raises:
+        ValueError: If fmt is not a known format.
+    """
+    if fmt == "text":
+        return render_text(text)
+    try:
+        index = _FORMAT_INDEX[fmt]
+    except KeyError:
+        raise ValueError(f"Unknown markup format: {fmt!r}") from None
+    if fmt == "html":
+        escape = html.escape
+    elif fmt == "markdown":
+        escape = lambda s: _MARKDOWN_SPECIAL.sub(r"\\\1", s)  # noqa: E731
+    else:
+        escape = str
+    if "{" not in text:
+        return escape(text)
+
+    parts: list[str] = []
+    for kind, value, fields in tokenize(text):
+        if kind == "text":
+            parts.append(escape(value))
+        elif kind == "open":
+            parts.append(_STYLES[value][2 * index])
+        elif kind == "close":
+            style = _STYLES.get(value)
+            if style is not None:
+                parts.append(style[2 * index + 1])
+        elif kind == "mark":
+            mark = _MARKS.get(value)
+            if mark is not None:
+                parts.append(mark[index])
+        elif value in _LINKS and fields:
+            label = escape(strip_homograph(fields[0]))
+            if index == 0:
+                parts.append(label)
+                continue
+            target = strip_homograph(fields[1] if len(fields) > 1 and fields[1] else fields[0])
+            url = f"{DICTIONARY_URL}/{quote(target)}"
+            parts.append(f'<a href="{url}">{label}</a>' if index == 1 else f"[{label}]({url})")
+    return "".join(parts)
@@ -1,15 +1,43 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
+
+# Fields exported only when requested (see config.ENTRY_FIELDS); every
+# field but word. homograph is set only when homographs are exported as
+# separate records.
+_OPTIONAL_FIELDS = (
+    "description",
+    "examples",
+    "homograph",
+    "pronunciations",
+    "functional_label",
+    "etymology",
+    "stems",
+    "offensive",
+)
 
 
 @dataclass
 class DictionaryEntry:
     word: str
-    description: str
-    examples: list[str] = field(default_factory=list)
+    description: str | None = None
+    examples: list[str] | None = None
+    homograph: int | None = None
+    pronunciations: list[str] | None = None
+    functional_label: str | None = None
+    etymology: str | None = None
+    stems: list[str] | None = None
+    offensive: bool | None = None
 
     def to_dict(self) -> dict[str, object]:
-        return {
-            "word": self.word,
-            "description": self.description,
-            "examples": self.examples,
-        }
+        data: dict[str, object] = {"word": self.word}
+        for name in _OPTIONAL_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "DictionaryEntry":
+        return cls(
+            word=data["word"],
+            **{name: data[name] for name in _OPTIONAL_FIELDS if name in data},
+        )
@@ -0,0 +1,29 @@
+import unicodedata
+from urllib.parse import quote
+
+
+def normalize_word(word: str) -> str:
+    """
+    Canonical lookup key for a saved word: Unicode NFC, runs of whitespace
+    collapsed to one space, trimmed and lower-cased. Case and spacing
+    variants of the same word map to the same key.
+    """
+    return " ".join(unicodedata.normalize("NFC", word).split()).lower()
+
+
+def url_segment(key: str) -> str:
+    """Percent-encodes a lookup key for use as one URL path segment ("a priori" -> "a%20priori")."""
+    return quote(key, safe="")
+
+
+def strip_homograph(entry_id: str) -> str:
+    """Drops a homograph suffix from an MW entry id or link target: "bear:2" -> "bear"."""
+    word, colon, number = entry_id.rpartition(":")
+    return word if colon and number.isdigit() else entry_id
+
+
+def entry_headword(raw: object) -> str:
+    """Headword of one entry of an API response (its meta.id less any homograph suffix)."""
+    if not isinstance(raw, dict):
+        return ""
+    return strip_homograph(raw.get("meta", {}).get("id", ""))
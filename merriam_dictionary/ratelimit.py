@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Thread-safe token-bucket rate limiter.
+
+    Tokens accrue at `rate` per second up to `burst`. Each acquire() takes one
+    token, sleeping first if none is available. Waiters reserve their token
+    under the lock and sleep outside it, so callers are served in arrival
+    order and the long-run rate never exceeds `rate` regardless of how many
+    threads share the bucket.
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be > 0 and burst >= 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Takes one token, possibly on credit, and returns how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        """Blocks until a token is available, then consumes it."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        """Like acquire(), but waits without blocking the event loop."""
+        wait = self._reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+def _wake(waiter: "asyncio.Future[None]") -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class AdaptiveLimiter:
+    """
+    AIMD controller for the number of requests in flight.
+
+    Callers wrap each request in acquire()/release(). Latencies are gathered
+    in windows of `window` samples; after each window the limit grows by one
+    if p95 latency stays within `latency_tolerance` × the best p95 seen, and
+    is cut by `latency_backoff` if it has risen beyond that. A 429 or 5xx
+    response cuts the limit immediately by `overload_backoff` and starts a
+    fresh window. At most one cut is made per round trip: overload responses
+    to requests sent before the last cut (release time less latency) are
+    ignored, so a burst of them from requests already in flight doesn't
+    compound it.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        window: int = 20,
+        latency_tolerance: float = 2.0,
+        latency_backoff: float = 0.75,
+        overload_backoff: float = 0.5,
+    ) -> None:
+        self.limit = max(minimum, min(initial, maximum))
+        self.minimum = minimum
+        self.maximum = maximum
+        self.peak_limit = self.limit
+        self.decreases = 0
+        self._window = window
+        self._latency_tolerance = latency_tolerance
+        self._latency_backoff = latency_backoff
+        self._overload_backoff = overload_backoff
+        self._in_flight = 0
+        self._samples: list[float] = []
+        self._best_p95: float | None = None
+        self._last_cut = float("-inf")
+        self._cond = threading.Condition()
+        # acquire_async() callers waiting for a slot, woken by release().
+        self._async_waiters: list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]] = []
+
+    def try_acquire(self) -> bool:
+        """Takes a slot if one is free under the current limit."""
+        with self._cond:
+            if self._in_flight >= self.limit:
+                return False
+            self._in_flight += 1
+            return True
+
+    def acquire(self) -> None:
+        """Blocks the calling thread until a slot is free, then takes it."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    async def acquire_async(self) -> None:
+        """Like acquire(), but awaits a wake-up from release() without blocking the event loop."""
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._in_flight < self.limit:
+                    self._in_flight += 1
+                    return
+                waiter: asyncio.Future[None] = loop.create_future()
+                self._async_waiters.append((loop, waiter))
+            try:
+                await waiter
+            finally:
+                with self._cond:
+                    if (loop, waiter) in self._async_waiters:
+                        self._async_waiters.remove((loop, waiter))
+
+    def release(self, latency: float, overloaded: bool = False) -> None:
+        """Frees a slot and feeds the request's outcome to the controller."""
+        sent_at = time.monotonic() - latency
+        with self._cond:
+            self._in_flight -= 1
+            if overloaded:
+                if sent_at >= self._last_cut:
+                    self._set_limit(int(self.limit * self._overload_backoff), "429/5xx response")
+                    self._samples.clear()
+            else:
+                self._samples.append(latency)
+                if len(self._samples) >= self._window:
+                    self._adjust()
+            waiters = self._notify_waiters()
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def abandon(self) -> None:
+        """Frees a slot whose request was never sent, without a latency sample."""
+        with self._cond:
+            self._in_flight -= 1
+            waiters = self._notify_waiters()
+        for loop, waiter in waiters:
+            loop.call_soon_threadsafe(_wake, waiter)
+
+    def _notify_waiters(self) -> list[tuple[asyncio.AbstractEventLoop, asyncio.Future[None]]]:
+        """Wakes acquire() callers and hands back acquire_async() waiters; call under the lock."""
+        self._cond.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        return waiters
+
+    def _adjust(self) -> None:
+        samples = sorted(self._samples)
+        self._samples.clear()
+        p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+        # The baseline drifts up slowly so a lasting shift in network latency
+        # doesn't pin the limit at its minimum forever.
+        if self._best_p95 is None:
+            self._best_p95 = p95
+        else:
+            self._best_p95 = min(p95, self._best_p95 * 1.05)
+
+        if p95 > self._best_p95 * self._latency_tolerance:
+            self._set_limit(
+                int(self.limit * self._latency_backoff),
+                f"p95 {p95 * 1000:.0f} ms vs best {self._best_p95 * 1000:.0f} ms",
+            )
+        else:
+            self._set_limit(self.limit + 1, f"p95 {p95 * 1000:.0f} ms")
+
+    def _set_limit(self, new_limit: int, reason: str) -> None:
+        new_limit = max(self.minimum, min(new_limit, self.maximum))
+        if new_limit == self.limit:
+            return
+        if new_limit < self.limit:
+            self.decreases += 1
+            self._last_cut = time.monotonic()
+        logger.info("Concurrency limit %d -> %d (%s).", self.limit, new_limit, reason)
+        self.limit = new_limit
+        self.peak_limit = max(self.peak_limit, new_limit)
@@ -0,0 +1,56 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+from .config import RETRY_BASE_DELAY_SECS, RETRY_MAX_DELAY_SECS
+
+
+class TransientLookupError(RuntimeError):
+    """Raised when a lookup still fails with a transient error after all retries."""
+
+
+def is_transient_status(status: int | None) -> bool:
+    """True for HTTP statuses worth retrying: 429 and any 5xx."""
+    return status is not None and (status == 429 or status >= 500)
+
+
+def describe_error(exc: BaseException, status: int | None = None) -> str:
+    """
+    Short description of a failed API request for logs and error messages:
+    the HTTP status if there was one, else the exception class. The
+    exception text is left out because requests and aiohttp include the
+    full URL in it, API key and all.
+    """
+    return f"HTTP {status}" if status is not None else type(exc).__name__
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parses a Retry-After header (delta-seconds or HTTP-date) into seconds from
+    now. Returns None if the header is absent or malformed.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: str | None = None) -> float:
+    """
+    Seconds to wait before retry number attempt + 1 (attempt counts from 0).
+
+    Uses exponential backoff with full jitter — a uniform draw from
+    [0, min(RETRY_MAX_DELAY_SECS, RETRY_BASE_DELAY_SECS × 2^attempt)] — so
+    workers that failed together don't retry together. A Retry-After header
+    sets a floor on the delay.
+    """
+    ceiling = min(RETRY_MAX_DELAY_SECS, RETRY_BASE_DELAY_SECS * 2**attempt)
+    delay = random.uniform(0, ceiling)
+    floor = parse_retry_after(retry_after)
+    return max(delay, floor) if floor is not None else delay
@@ -0,0 +1,46 @@
+import json
+import logging
+import os
+
+logger = logging.getLogger(__name__)
+
+
+def write_private_json(path: str, data: object) -> None:
+    """
+    Atomically writes data as JSON to path, readable and writable only by the
+    current user (0600). Parent directories are created with 0700.
+
+    The file is written to a temp path alongside the target and renamed into
+    place, so a crash mid-write never leaves a truncated file behind.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, mode=0o700, exist_ok=True)
+
+    tmp_path = f"{path}.tmp"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+def read_json(path: str) -> object | None:
+    """
+    Reads JSON from path. Returns None if the file is missing or unreadable,
+    so callers can treat a corrupt file the same as an absent one.
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring unreadable file %s: %s", path, exc)
+        return None
+
+
+def remove_file(path: str) -> None:
+    """Deletes path if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
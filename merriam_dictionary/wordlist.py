@@ -1,12 +1,30 @@
 import logging
+import threading
 import time
+from collections import deque
+from collections.abc import Callable, Container, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 
 import requests
 
-from .config import WORDLIST_API_URL, WORDLIST_DELAY_SECS, WORDS_PER_PAGE
+from .config import (
+    PER_PAGE_CACHE_TTL_SECS,
+    WORDLIST_API_URL,
+    WORDLIST_CONNECT_TIMEOUT_SECS,
+    WORDLIST_MAX_WORKERS,
+    WORDLIST_RATE_BURST,
+    WORDLIST_RATE_PER_SEC,
+    WORDLIST_READ_TIMEOUT_SECS,
+    WORDS_PER_PAGE,
+    WORDS_PER_PAGE_CANDIDATES,
+)
+from .ratelimit import TokenBucket
+from .storage import read_json, write_private_json
 
 logger = logging.getLogger(__name__)
 
+_rate_limiter = TokenBucket(WORDLIST_RATE_PER_SEC, WORDLIST_RATE_BURST)
+
 # Headers that signal an XHR request to the MW API. Stripped of browser
 # fingerprint headers (sec-ch-ua, etc.) that are meaningless from requests.
 _HEADERS: dict[str, str] = {
@@ -20,6 +38,10 @@ _HEADERS: dict[str, str] = {
 }
 
 
+class SessionRejectedError(RuntimeError):
+    """Raised when the wordlist API refuses the supplied session cookies."""
+
+
 def _build_session(cookies: list[dict]) -> requests.Session:
     session = requests.Session()
     for cookie in cookies:
@@ -27,57 +49,278 @@ def _build_session(cookies: list[dict]) -> requests.Session:
     return session
 
 
-def fetch_saved_words(cookies: list[dict]) -> list[str]:
+def _fetch_page(
+    session: requests.Session,
+    page: int,
+    per_page: int,
+) -> dict:
+    """Fetches one wordlist page and returns its inner data dict."""
+    params: dict[str, object] = {
+        "search": "",
+        "sort": "newest",
+        "filter": "dt",
+        "page": page,
+        "perPage": per_page,
+    }
+    _rate_limiter.acquire()
+    response = session.get(
+        WORDLIST_API_URL,
+        params=params,
+        headers=_HEADERS,
+        timeout=(WORDLIST_CONNECT_TIMEOUT_SECS, WORDLIST_READ_TIMEOUT_SECS),
+    )
+    if response.status_code in (401, 403) or "/login" in response.url:
+        raise SessionRejectedError(
+            f"Wordlist API rejected the session (HTTP {response.status_code})."
+        )
+    response.raise_for_status()
+    return response.json().get("data", {}).get("data", {})
+
+
+def _negotiate_per_page(
+    fetch: Callable[[int, int], dict],
+    cache_file: str | None,
+) -> tuple[int, dict | None]:
+    """
+    Determines the largest perPage the wordlist API honours.
+
+    A previously discovered value is reused from cache_file while younger than
+    PER_PAGE_CACHE_TTL_SECS. Otherwise page 1 is requested with each of
+    WORDS_PER_PAGE_CANDIDATES (largest first) until one succeeds, and the
+    returned item count is compared with the request:
+
+      - a full page means the candidate is honoured;
+      - a short page with more pages behind it means the server capped
+        perPage at the returned count, unless fewer than WORDS_PER_PAGE
+        came back (e.g. none), which counts as a failed probe;
+      - a short final page means the whole list fit, which proves nothing
+        about the cap, so the result is used but not cached.
+
+    Returns:
+        (per_page, first_page). first_page is the probe's page-1 data when it
+        was fetched with the returned per_page and can be reused; else None.
+        Falls back to (WORDS_PER_PAGE, None) if every probe fails.
+    """
+    cached = read_json(cache_file) if cache_file else None
+    if (
+        isinstance(cached, dict)
+        and isinstance(cached.get("per_page"), int)
+        and cached["per_page"] >= WORDS_PER_PAGE
+    ):
+        age = time.time() - float(cached.get("discovered_at", 0))
+        if age < PER_PAGE_CACHE_TTL_SECS:
+            logger.info("Using cached perPage=%d.", cached["per_page"])
+            return cached["per_page"], None
+
+    for candidate in WORDS_PER_PAGE_CANDIDATES:
+        try:
+            data = fetch(1, candidate)
+        except (requests.HTTPError, ValueError) as exc:
+            logger.info("perPage=%d rejected by wordlist API: %s", candidate, exc)
+            continue
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            logger.info("perPage=%d probe failed: %s", candidate, exc)
+            continue
+
+        returned = len(data.get("items", []))
+        total_pages = int(data.get("totalPages", 0))
+        if returned < candidate and total_pages <= 1:
+            logger.info("Whole list fits in one page of %d; perPage cap unknown.", candidate)
+            return candidate, data
+        if returned < WORDS_PER_PAGE:
+            logger.info(
+                "perPage=%d probe returned %d items with %d pages; ignoring it.",
+                candidate, returned, total_pages,
+            )
+            continue
+
+        per_page = min(returned, candidate)
+        logger.info("Wordlist API honours perPage=%d (requested %d).", per_page, candidate)
+        if cache_file:
+            write_private_json(cache_file, {"per_page": per_page, "discovered_at": time.time()})
+        return per_page, data if per_page == candidate else None
+
+    logger.warning("perPage probe failed; falling back to %d.", WORDS_PER_PAGE)
+    return WORDS_PER_PAGE, None
+
+
+def _page_words(data: dict) -> list[str]:
+    items: list[dict] = data.get("items", [])
+    return [item["word"] for item in items if item.get("word")]
+
+
+def _check_page(
+    data: dict,
+    page: int,
+    total_pages: int,
+    per_page: int,
+    previous: set[str],
+) -> list[str]:
+    """
+    Returns the words of one page, checking for signs that the list changed
+    while it was being fetched:
+
+      - duplicates of the previous page's words (a word was saved mid-fetch,
+        shifting later items down a page) are dropped;
+      - short non-final pages or a changed totalPages (a word was removed,
+        shifting items up past a page that was already fetched) are logged as
+        possible gaps.
+
+    Only the previous page is consulted, since a shift smaller than a page can
+    only push items across one boundary — memory stays bounded by page size.
+    """
+    words = _page_words(data)
+
+    reported = int(data.get("totalPages", total_pages))
+    if reported != total_pages:
+        logger.warning(
+            "Page %d reports %d total pages (expected %d); list changed mid-fetch.",
+            page, reported, total_pages,
+        )
+    if page < total_pages and len(data.get("items", [])) < per_page:
+        logger.warning(
+            "Page %d returned %d of %d items; words may be missing.",
+            page, len(data.get("items", [])), per_page,
+        )
+
+    duplicates = [word for word in words if word in previous]
+    if duplicates:
+        logger.warning(
+            "Dropping %d duplicate word(s) at start of page %d: %s",
+            len(duplicates), page, ", ".join(duplicates),
+        )
+        words = [word for word in words if word not in previous]
+
+    logger.info("Captured %d words from page %d / %d.", len(words), page, total_pages)
+    return words
+
+
+def iter_saved_word_pages(
+    cookies: list[dict],
+    per_page_cache_file: str | None = None,
+) -> Iterator[list[str]]:
+    """
+    Yields the authenticated user's MW saved words one page at a time, in
+    page order, as soon as each page has been decoded.
+
+    Uses plain HTTP sessions loaded with browser cookies — no browser needed.
+    The page size is negotiated once (see _negotiate_per_page) and cached in
+    per_page_cache_file. Page 1 is fetched first to learn totalPages; later
+    pages are fetched by up to WORDLIST_MAX_WORKERS threads, all drawing
+    from the shared WORDLIST_RATE_PER_SEC token bucket. At most
+    2 × WORDLIST_MAX_WORKERS pages are in flight or buffered at once, so
+    memory does not grow with the size of the list.
+
+    Closing the generator early cancels pages that have not been requested.
+
+    Args:
+        cookies: Session cookies from a prior login_and_get_cookies() call.
+        per_page_cache_file: Where to remember the negotiated perPage, or
+            None to probe on every call.
+
+    Yields:
+        Lists of saved word strings, one per page (newest first).
+
+    Raises:
+        SessionRejectedError: If the API rejects the cookies (401/403 or a
+            redirect to the login page).
+        requests.HTTPError: On other non-2xx responses from the wordlist API.
+    """
+    local = threading.local()
+
+    def fetch(page: int, per_page: int) -> dict:
+        if not hasattr(local, "session"):
+            local.session = _build_session(cookies)
+        return _fetch_page(local.session, page, per_page)
+
+    per_page, first = _negotiate_per_page(fetch, per_page_cache_file)
+    if first is None:
+        first = fetch(1, per_page)
+    total_pages = max(int(first.get("totalPages", 0)), 1)
+    logger.info("Total pages: %d", total_pages)
+
+    words = _check_page(first, 1, total_pages, per_page, set())
+    previous = set(words)
+    yield words
+    if total_pages == 1:
+        return
+
+    window = 2 * WORDLIST_MAX_WORKERS
+    executor = ThreadPoolExecutor(max_workers=WORDLIST_MAX_WORKERS)
+    pending: deque[Future[dict]] = deque()
+    next_page = 2
+    try:
+        for page in range(2, total_pages + 1):
+            while next_page <= total_pages and len(pending) < window:
+                pending.append(executor.submit(fetch, next_page, per_page))
+                next_page += 1
+            data = pending.popleft().result()
+            words = _check_page(data, page, total_pages, per_page, previous)
+            previous = set(words)
+            yield words
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def words_from_pages(
+    pages: Iterator[list[str]],
+    stop_at: Container[str] | None = None,
+) -> Iterator[str]:
+    """
+    Flattens page batches into single words. If stop_at is given, iteration
+    ends at the first word it contains — with the list sorted newest first,
+    that is where previously seen words begin.
+
+    pages is closed on exit, so no further pages are requested once the
+    caller stops or a known word is reached.
+    """
+    try:
+        for words in pages:
+            for word in words:
+                if stop_at is not None and word in stop_at:
+                    logger.info("Reached already-known word '%s'; stopping pagination.", word)
+                    return
+                yield word
+    finally:
+        close = getattr(pages, "close", None)
+        if close is not None:
+            close()
+
+
+def iter_saved_words(
+    cookies: list[dict],
+    per_page_cache_file: str | None = None,
+    stop_at: Container[str] | None = None,
+) -> Iterator[str]:
+    """
+    Yields saved words one at a time; see iter_saved_word_pages() and
+    words_from_pages().
+    """
+    return words_from_pages(iter_saved_word_pages(cookies, per_page_cache_file), stop_at)
+
+
+def fetch_saved_words(
+    cookies: list[dict],
+    per_page_cache_file: str | None = None,
+) -> list[str]:
     """
     Fetches all words from the authenticated user's MW saved-words list.
 
-    Uses a plain HTTP session loaded with browser cookies — no browser needed.
-    Paginates automatically until all pages are consumed.
+    A thin wrapper that drains iter_saved_words() into a list.
 
     Args:
         cookies: Session cookies from a prior login_and_get_cookies() call.
+        per_page_cache_file: Where to remember the negotiated perPage, or
+            None to probe on every call.
 
     Returns:
         Ordered list of saved word strings (newest first).
 
     Raises:
-        requests.HTTPError: On non-2xx responses from the wordlist API.
+        SessionRejectedError: If the API rejects the cookies (401/403 or a
+            redirect to the login page).
+        requests.HTTPError: On other non-2xx responses from the wordlist API.
     """
-    session = _build_session(cookies)
-    all_words: list[str] = []
-    total_pages: int = 0
-    page: int = 1
-
-    while True:
-        params: dict[str, object] = {
-            "search": "",
-            "sort": "newest",
-            "filter": "dt",
-            "page": page,
-            "perPage": WORDS_PER_PAGE,
-        }
-        response = session.get(WORDLIST_API_URL, params=params, headers=_HEADERS)
-        response.raise_for_status()
-
-        data = response.json().get("data", {}).get("data", {})
-
-        if page == 1:
-            total_pages = int(data.get("totalPages", 0))
-            logger.info("Total pages: %d", total_pages)
-
-        items: list[dict] = data.get("items", [])
-        if not items:
-            break
-
-        words = [item["word"] for item in items if item.get("word")]
-        all_words.extend(words)
-        logger.info("Captured %d words from page %d / %d.", len(words), page, total_pages)
-
-        if page >= total_pages:
-            break
-
-        page += 1
-        time.sleep(WORDLIST_DELAY_SECS)
-
+    all_words = list(iter_saved_words(cookies, per_page_cache_file))
     logger.info("Total saved words captured: %d", len(all_words))
     return all_words